@@ -0,0 +1,2 @@
+#Scripts de benchmark. Se corren desde la raiz del proyecto, por ejemplo:
+#   python -m benchmarks.busqueda_fts
@@ -0,0 +1,108 @@
+# benchmarks/busqueda_fts.py
+#Compara la busqueda con ilike('%termino%') contra el indice FTS5 a distintos tamaños de catalogo
+#Usa una base SQLite temporal (no toca inventario.db) con las mismas sentencias que usa la app
+#
+#   python -m benchmarks.busqueda_fts
+#   python -m benchmarks.busqueda_fts --tamanos 10000,100000 --repeticiones 20
+
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from app import normalize_text, construir_consulta_fts, SQL_INDICE_BUSQUEDA
+
+PRODUCTOS= ['Harina de Almendras', 'Aceite de Coco', 'Azúcar Mascabo', 'Avena Instantánea', 'Té Verde',
+            'Pasas de Uva', 'Maní Tostado', 'Garbanzos', 'Lentejas', 'Semillas de Chía', 'Quínoa Roja',
+            'Leche de Almendras', 'Galletitas de Arroz', 'Miel Orgánica', 'Yerba Mate Compuesta', 'Nueces Peladas',
+            'Castañas de Cajú', 'Granola Crocante', 'Harina de Garbanzo', 'Fideos de Arroz', 'Café de Especialidad']
+VARIANTES= ['', 'Integral', 'Orgánico', 'Sin TACC', 'Light', 'Premium', 'x 500g', 'x 1kg', 'Clásico', 'Fácil']
+MARCAS= ['Natura', 'Arcor', 'Dicomere', 'Granix', 'Molinos Ñandú', 'La Campagnola', 'Sol Azteca', 'Cabaña Ñire',
+         'Yin Yang', 'Hierbas del Oasis', 'Nutrición Pura', 'Campo Claro']
+#Terminos que se buscan en cada corrida (tal cual los tipearia alguien)
+BUSQUEDAS= ['almendra', 'arroz', 'ñandu', 'té verde', 'harina garbanzo', 'organico', 'zzz']
+
+POR_PAGINA= 21
+
+
+def crear_base(path, cantidad, semilla):
+    rnd= random.Random(semilla)
+    conn= sqlite3.connect(path)
+    conn.execute('''CREATE TABLE producto (
+        id INTEGER PRIMARY KEY,
+        nombre_normalizado VARCHAR(150) NOT NULL,
+        marca_normalizada VARCHAR(150) NOT NULL
+    )''')
+    #Las sentencias de la app (tabla FTS5 y triggers) se crean antes de insertar, asi medimos tambien el costo de mantenerlo
+    for sentencia in SQL_INDICE_BUSQUEDA:
+        conn.execute(sentencia)
+
+    def filas():
+        for i in range(1, cantidad + 1):
+            nombre= f'{rnd.choice(PRODUCTOS)} {rnd.choice(VARIANTES)} {i}'
+            yield i, normalize_text(nombre), normalize_text(rnd.choice(MARCAS))
+
+    inicio= time.perf_counter()
+    conn.executemany('INSERT INTO producto (id, nombre_normalizado, marca_normalizada) VALUES (?, ?, ?)', filas())
+    conn.commit()
+    return conn, time.perf_counter() - inicio
+
+
+#Lo mismo que hace inicio(): contar los resultados y traer la primera pagina
+def buscar_ilike(conn, termino):
+    patron= f'%{termino}%'
+    filtro= 'nombre_normalizado LIKE ? OR marca_normalizada LIKE ?'
+    total= conn.execute(f'SELECT count(*) FROM producto WHERE {filtro}', (patron, patron)).fetchone()[0]
+    conn.execute(f'SELECT id FROM producto WHERE {filtro} ORDER BY id LIMIT ?', (patron, patron, POR_PAGINA)).fetchall()
+    return total
+
+def buscar_fts(conn, termino):
+    consulta= construir_consulta_fts(termino)
+    total= conn.execute('SELECT count(*) FROM producto_fts WHERE producto_fts MATCH ?', (consulta,)).fetchone()[0]
+    conn.execute(
+        'SELECT p.id FROM producto p JOIN (SELECT rowid AS id, bm25(producto_fts) AS relevancia FROM producto_fts '
+        'WHERE producto_fts MATCH ?) r ON r.id = p.id ORDER BY r.relevancia LIMIT ?', (consulta, POR_PAGINA)).fetchall()
+    return total
+
+def medir(funcion, conn, terminos, repeticiones):
+    tiempos= []
+    for _ in range(repeticiones):
+        for termino in terminos:
+            inicio= time.perf_counter()
+            funcion(conn, termino)
+            tiempos.append(time.perf_counter() - inicio)
+    tiempos.sort()
+    return tiempos[len(tiempos) // 2], tiempos[int(len(tiempos) * 0.95)]
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark de busqueda ilike vs FTS5')
+    parser.add_argument('--tamanos', default='10000,100000,1000000', help='Cantidades de productos separadas por coma')
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--semilla', type=int, default=42)
+    args= parser.parse_args()
+
+    terminos= [normalize_text(b) for b in BUSQUEDAS]
+
+    print(f'{"productos":>10} {"carga (s)":>10} {"ilike p50":>11} {"ilike p95":>11} {"fts5 p50":>10} {"fts5 p95":>10} {"mejora":>8}')
+    for cantidad in [int(t) for t in args.tamanos.split(',')]:
+        with tempfile.TemporaryDirectory() as carpeta:
+            conn, tiempo_carga= crear_base(os.path.join(carpeta, 'bench.db'), cantidad, args.semilla)
+
+            #Antes de medir verificamos que FTS5 encuentre todo lo que encuentra ilike para busquedas de palabras completas
+            for termino in terminos:
+                if buscar_fts(conn, termino) < buscar_ilike(conn, termino):
+                    print(f'  aviso: "{termino}" tiene menos resultados con FTS5 que con ilike')
+
+            ilike_p50, ilike_p95= medir(buscar_ilike, conn, terminos, args.repeticiones)
+            fts_p50, fts_p95= medir(buscar_fts, conn, terminos, args.repeticiones)
+            conn.close()
+
+        print(f'{cantidad:>10} {tiempo_carga:>10.2f} {ilike_p50 * 1000:>9.2f}ms {ilike_p95 * 1000:>9.2f}ms '
+              f'{fts_p50 * 1000:>8.2f}ms {fts_p95 * 1000:>8.2f}ms {ilike_p50 / fts_p50:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+# benchmarks/carga.py
+#Prueba de carga contra un servidor de verdad (por HTTP): varios hilos piden el listado (/), agregan productos
+#(/agregar_producto, con el token CSRF del formulario) y mueven stock (/productos/<id>/stock) al mismo tiempo
+#Informa peticiones por segundo y latencias (p50/p95/p99/max) de cada operacion y del total
+#
+#Sin --url levanta gunicorn (gunicorn.conf.py) con un catalogo sintetico en una base temporal y lo apaga al terminar:
+#   python -m benchmarks.carga
+#   python -m benchmarks.carga --workers 4 --threads 8 --hilos 32 --segundos 30
+#Con --url prueba un servidor que ya esta corriendo (agrega productos y cambia stock: no usar con datos reales):
+#   python -m benchmarks.carga --url http://127.0.0.1:8000 --segundos 60
+
+import argparse
+import http.client
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.cookies import SimpleCookie
+
+from benchmarks.generador import TIPOS, MARCAS
+
+
+CARPETA_PROYECTO= os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUSQUEDAS= ['almendra', 'harina', 'té verde', 'ñandu', 'organico', 'quinoa']
+ORDENES= ['id', 'nombre', 'precio', 'stock']
+
+
+def percentil(ordenados, p):
+    return ordenados[max(0, math.ceil(len(ordenados) * p / 100) - 1)]
+
+#Una conexion HTTP (keep-alive) por hilo, con la cookie de sesion de Flask (hace falta para el token CSRF)
+class Cliente:
+    def __init__(self, url):
+        partes= urllib.parse.urlsplit(url)
+        self.host= partes.hostname
+        self.puerto= partes.port or 80
+        self.conexion= None
+        self.cookies= SimpleCookie()
+
+    def pedir(self, metodo, ruta, cuerpo=None, tipo=None):
+        encabezados= {}
+        if tipo:
+            encabezados['Content-Type']= tipo
+        if self.cookies:
+            encabezados['Cookie']= '; '.join(f'{nombre}={c.value}' for nombre, c in self.cookies.items())
+        for intento in range(2):
+            if self.conexion is None:
+                self.conexion= http.client.HTTPConnection(self.host, self.puerto, timeout=60)
+            try:
+                self.conexion.request(metodo, ruta, body=cuerpo, headers=encabezados)
+                respuesta= self.conexion.getresponse()
+                datos= respuesta.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                #El servidor cerro la conexion (keep-alive vencido o worker reemplazado): una nueva y otra vez
+                self.conexion.close()
+                self.conexion= None
+                if intento:
+                    raise
+        for cookie in respuesta.headers.get_all('Set-Cookie') or []:
+            self.cookies.load(cookie)
+        return respuesta.status, datos
+
+    def cerrar(self):
+        if self.conexion is not None:
+            self.conexion.close()
+
+#Ids de productos para mover stock: los primeros que devuelve la API
+def ids_de_productos(url, cantidad=1000):
+    cliente= Cliente(url)
+    ids, cursor= [], None
+    while len(ids) < cantidad:
+        ruta= '/api/v1/productos?fields=id&limite=200' + (f'&despues={cursor}' if cursor else '')
+        estado, datos= cliente.pedir('GET', ruta)
+        if estado != 200:
+            raise SystemExit(f'No se pudieron leer los productos ({estado})')
+        respuesta= json.loads(datos)
+        ids+= [producto['id'] for producto in respuesta['productos']]
+        cursor= respuesta.get('siguiente')
+        if not cursor:
+            break
+    cliente.cerrar()
+    if not ids:
+        raise SystemExit('El servidor no tiene productos')
+    return ids
+
+#Cada hilo elige una operacion al azar segun la mezcla y la repite hasta que se termina el tiempo
+def correr(url, args, ids, mezcla):
+    resultados= {nombre: {'tiempos': [], 'errores': 0, 'rechazos': 0} for nombre in mezcla}
+    lock= threading.Lock()
+    tiempos= {}
+
+    #Todos los hilos arrancan juntos, cuando ya tienen su token: recien ahi empieza a correr el tiempo
+    def largar():
+        tiempos['inicio']= time.perf_counter()
+        tiempos['fin']= tiempos['inicio'] + args.segundos
+    barrera= threading.Barrier(args.hilos, action=largar)
+
+    def hilo(numero):
+        rnd= random.Random(args.semilla + numero)
+        cliente= Cliente(url)
+        #El token CSRF vale para toda la sesion: se pide el formulario una sola vez
+        _, html= cliente.pedir('GET', '/agregar_producto')
+        token= re.search(rb'name="csrf_token" type="hidden" value="([^"]+)"', html)
+        token= token.group(1).decode() if token else ''
+        propios= {nombre: {'tiempos': [], 'errores': 0, 'rechazos': 0} for nombre in mezcla}
+        agregados= 0
+
+        barrera.wait()
+        while time.perf_counter() < tiempos['fin']:
+            operacion= rnd.choices(list(mezcla), list(mezcla.values()))[0]
+            if operacion == 'listado':
+                parametros= {'sort_by': rnd.choice(ORDENES), 'order': rnd.choice(('asc', 'desc')),
+                             'page': rnd.randint(1, 20)}
+                if rnd.random() < 0.3:
+                    parametros['q']= rnd.choice(BUSQUEDAS)
+                pedido= ('GET', '/?' + urllib.parse.urlencode(parametros), None, None)
+                esperado= (200,)
+            elif operacion == 'agregar':
+                agregados += 1
+                cuerpo= urllib.parse.urlencode({
+                    'csrf_token': token, 'nombre': f'{rnd.choice(TIPOS)} Carga {numero}-{agregados}-{rnd.random():.6f}',
+                    'marca': rnd.choice(MARCAS), 'precio': f'{rnd.uniform(100, 5000):.2f}', 'stock': rnd.randint(1, 100),
+                })
+                pedido= ('POST', '/agregar_producto', cuerpo, 'application/x-www-form-urlencoded')
+                esperado= (302,)
+            else:
+                cuerpo= json.dumps({'tipo': rnd.choice(('entrada', 'salida')), 'cantidad': rnd.randint(1, 3)})
+                pedido= ('POST', f'/productos/{rnd.choice(ids)}/stock', cuerpo, 'application/json')
+                esperado= (201,)
+
+            inicio= time.perf_counter()
+            try:
+                estado, _= cliente.pedir(*pedido)
+            except (OSError, http.client.HTTPException):
+                estado= None
+            propios[operacion]['tiempos'].append(time.perf_counter() - inicio)
+            if estado in esperado:
+                continue
+            #Una salida sin stock suficiente es una respuesta correcta del servidor
+            if operacion == 'stock' and estado == 409:
+                propios[operacion]['rechazos'] += 1
+            else:
+                propios[operacion]['errores'] += 1
+        cliente.cerrar()
+
+        with lock:
+            for nombre, datos in propios.items():
+                resultados[nombre]['tiempos']+= datos['tiempos']
+                resultados[nombre]['errores'] += datos['errores']
+                resultados[nombre]['rechazos'] += datos['rechazos']
+
+    hilos= [threading.Thread(target=hilo, args=(n,)) for n in range(args.hilos)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    return resultados, time.perf_counter() - tiempos['inicio']
+
+def imprimir(resultados, segundos):
+    print(f'{"operacion":<10} {"peticiones":>10} {"por seg":>9} {"errores":>8} {"rechazos":>8} '
+          f'{"p50":>9} {"p95":>9} {"p99":>9} {"max":>9}')
+    filas= list(resultados.items())
+    filas.append(('total', {'tiempos': [t for r in resultados.values() for t in r['tiempos']],
+                            'errores': sum(r['errores'] for r in resultados.values()),
+                            'rechazos': sum(r['rechazos'] for r in resultados.values())}))
+    for nombre, datos in filas:
+        ordenados= sorted(datos['tiempos'])
+        if not ordenados:
+            print(f'{nombre:<10} {0:>10}')
+            continue
+        latencias= ' '.join(f'{percentil(ordenados, p) * 1000:>7.1f}ms' for p in (50, 95, 99))
+        print(f'{nombre:<10} {len(ordenados):>10} {len(ordenados) / segundos:>9.1f} {datos["errores"]:>8} '
+              f'{datos["rechazos"]:>8} {latencias} {ordenados[-1] * 1000:>7.1f}ms')
+
+#Carga el catalogo en una base temporal y levanta gunicorn con gunicorn.conf.py. Devuelve el proceso
+def levantar_servidor(args, carpeta):
+    base= 'sqlite:///' + os.path.join(carpeta, 'carga.db')
+    entorno= dict(os.environ, DATABASE_URL=base, CONSULTAS_LENTAS_LOG=os.path.join(carpeta, 'consultas_lentas.log'),
+                  GUNICORN_BIND=f'127.0.0.1:{args.puerto}', GUNICORN_WORKERS=str(args.workers),
+                  GUNICORN_THREADS=str(args.threads))
+    #Primero el esquema (migraciones) y despues los productos: asi la base queda como una de produccion
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'db', 'upgrade'], cwd=CARPETA_PROYECTO, env=entorno,
+                   check=True, capture_output=True)
+    subprocess.run([sys.executable, '-m', 'benchmarks.generador', '--url', base, '--productos', str(args.productos),
+                    '--categorias', str(args.categorias), '--semilla', str(args.semilla)],
+                   cwd=CARPETA_PROYECTO, env=entorno, check=True)
+    entorno['MIGRAR_AL_INICIAR']= '0'
+    servidor= subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py'], cwd=CARPETA_PROYECTO,
+                               env=entorno, stderr=open(os.path.join(carpeta, 'gunicorn.log'), 'w'))
+    url= f'http://127.0.0.1:{args.puerto}'
+    limite= time.perf_counter() + 30
+    while time.perf_counter() < limite:
+        if servidor.poll() is not None:
+            raise SystemExit('gunicorn no arranco:\n' + open(os.path.join(carpeta, 'gunicorn.log')).read())
+        try:
+            if Cliente(url).pedir('GET', '/api/v1/categorias')[0] == 200:
+                return servidor, url
+        except OSError:
+            time.sleep(0.2)
+    servidor.terminate()
+    raise SystemExit('gunicorn no respondio en 30s')
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Prueba de carga por HTTP: listado, agregar productos y movimientos de stock')
+    parser.add_argument('--url', help='Servidor a probar (si no, se levanta gunicorn con una base temporal)')
+    parser.add_argument('--segundos', type=float, default=15)
+    parser.add_argument('--hilos', type=int, default=16, help='Clientes a la vez')
+    parser.add_argument('--mezcla', default='listado=70,agregar=10,stock=20',
+                        help='Peso de cada operacion (listado, agregar, stock)')
+    parser.add_argument('--semilla', type=int, default=42)
+    #Solo para el servidor que se levanta
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--productos', type=int, default=20000)
+    parser.add_argument('--categorias', type=int, default=30)
+    parser.add_argument('--puerto', type=int, default=8765)
+    args= parser.parse_args()
+
+    mezcla= {}
+    for parte in args.mezcla.split(','):
+        nombre, _, peso= parte.partition('=')
+        if nombre not in ('listado', 'agregar', 'stock') or not peso.isdigit():
+            parser.error(f'Mezcla invalida: {parte}')
+        if int(peso):
+            mezcla[nombre]= int(peso)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        servidor, url= None, args.url
+        if url is None:
+            servidor, url= levantar_servidor(args, carpeta)
+            print(f'gunicorn con {args.workers} workers x {args.threads} hilos, {args.productos} productos')
+        try:
+            ids= ids_de_productos(url)
+            print(f'{args.hilos} clientes durante {args.segundos:g}s contra {url}\n')
+            resultados, segundos= correr(url, args, ids, mezcla)
+        finally:
+            if servidor is not None:
+                #TERM: gunicorn espera a las peticiones en curso y termina
+                servidor.terminate()
+                servidor.wait(timeout=60)
+    imprimir(resultados, segundos)
+    if any(r['errores'] for r in resultados.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
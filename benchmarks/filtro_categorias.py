@@ -0,0 +1,108 @@
+# benchmarks/filtro_categorias.py
+#Compara el filtro por categorias anterior (un EXISTS correlacionado por categoria) contra filtrar_por_categorias
+#(una subconsulta con GROUP BY/HAVING). Antes de medir verifica que las dos devuelvan exactamente los mismos productos
+#Usa una base SQLite temporal con el mismo esquema de la app (no toca inventario.db)
+#
+#   python -m benchmarks.filtro_categorias
+#   python -m benchmarks.filtro_categorias --productos 20000 --categorias 20
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select, insert
+from sqlalchemy.orm import Session
+
+from app import db, Producto, Categoria, producto_categoria, filtrar_por_categorias
+
+
+#Como filtraba inicio() antes: un .any() (EXISTS correlacionado) por cada categoria en AND, uno solo con IN en OR
+def filtrar_con_exists(query, category_ids, logic_type):
+    if logic_type == 'and':
+        for cat_id in category_ids:
+            query= query.filter(Producto.categorias.any(Categoria.id == cat_id))
+    else:
+        query= query.filter(Producto.categorias.any(Categoria.id.in_(category_ids)))
+    return query
+
+
+def crear_base(engine, cantidad_productos, cantidad_categorias, rnd):
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Categoria), [{'id': i, 'nombre': f'Categoria {i}'} for i in range(1, cantidad_categorias + 1)])
+        conn.execute(insert(Producto), [
+            {'id': i, 'nombre': f'Producto {i}', 'nombre_normalizado': f'producto {i}', 'marca': 'Marca',
+             'marca_normalizada': 'marca', 'precio': 1.0, 'stock': 1}
+            for i in range(1, cantidad_productos + 1)
+        ])
+        #Cada producto tiene entre 0 y 6 categorias. Algunas categorias son mucho mas comunes que otras
+        pesos= [1 / (i ** 0.8) for i in range(1, cantidad_categorias + 1)]
+        relaciones= []
+        for producto_id in range(1, cantidad_productos + 1):
+            elegidas= set(rnd.choices(range(1, cantidad_categorias + 1), weights=pesos, k=rnd.randint(0, 6)))
+            relaciones.extend({'producto_id': producto_id, 'categoria_id': c} for c in elegidas)
+        conn.execute(insert(producto_categoria), relaciones)
+    return len(relaciones)
+
+def medir(session, filtro, category_ids, logic_type, repeticiones):
+    consulta= filtro(select(Producto.id), category_ids, logic_type).order_by(Producto.id)
+    tiempos= []
+    for _ in range(repeticiones):
+        inicio= time.perf_counter()
+        ids= session.execute(consulta).scalars().all()
+        tiempos.append(time.perf_counter() - inicio)
+    return ids, min(tiempos)
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark del filtro por categorias (EXISTS vs GROUP BY)')
+    parser.add_argument('--productos', type=int, default=100000)
+    parser.add_argument('--categorias', type=int, default=50)
+    parser.add_argument('--combinaciones', type=int, default=10, help='Selecciones de categorias al azar por cada tamaño')
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--semilla', type=int, default=42)
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        engine= create_engine('sqlite:///' + os.path.join(carpeta, 'bench.db'))
+        relaciones= crear_base(engine, args.productos, args.categorias, rnd)
+        print(f'{args.productos} productos, {args.categorias} categorias, {relaciones} relaciones\n')
+        print(f'{"logica":>6} {"n cat":>5} {"resultados":>10} {"EXISTS":>10} {"GROUP BY":>10} {"mejora":>7}')
+
+        with Session(engine) as session:
+            #Casos borde: categorias repetidas en la URL y categorias que no existen
+            for category_ids in ([1, 1], [1, 2, 2], [1, args.categorias + 100], [args.categorias + 100]):
+                for logic_type in ('and', 'or'):
+                    if medir(session, filtrar_con_exists, category_ids, logic_type, 1)[0] != \
+                            medir(session, filtrar_por_categorias, category_ids, logic_type, 1)[0]:
+                        raise SystemExit(f'Resultados distintos para {logic_type} {category_ids}')
+
+            for logic_type in ('and', 'or'):
+                for n in (1, 2, 3, 5):
+                    total_exists= total_grupo= 0
+                    resultados= 0
+                    for _ in range(args.combinaciones):
+                        category_ids= rnd.sample(range(1, args.categorias + 1), n)
+                        ids_exists, tiempo_exists= medir(session, filtrar_con_exists, category_ids, logic_type, args.repeticiones)
+                        ids_grupo, tiempo_grupo= medir(session, filtrar_por_categorias, category_ids, logic_type, args.repeticiones)
+                        #Los dos filtros tienen que devolver lo mismo
+                        if ids_exists != ids_grupo:
+                            raise SystemExit(f'Resultados distintos para {logic_type} {category_ids}: '
+                                             f'{len(ids_exists)} (EXISTS) vs {len(ids_grupo)} (GROUP BY)')
+                        total_exists+= tiempo_exists
+                        total_grupo+= tiempo_grupo
+                        resultados+= len(ids_grupo)
+                    promedio_exists= total_exists / args.combinaciones
+                    promedio_grupo= total_grupo / args.combinaciones
+                    print(f'{logic_type:>6} {n:>5} {resultados // args.combinaciones:>10} {promedio_exists * 1000:>8.1f}ms '
+                          f'{promedio_grupo * 1000:>8.1f}ms {promedio_exists / promedio_grupo:>6.1f}x')
+        engine.dispose()
+
+    print('\nLos dos filtros devolvieron los mismos productos en todas las combinaciones.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# benchmarks/generador.py
+#Genera un catalogo sintetico de N productos en M categorias, siempre igual para la misma semilla
+#Los nombres son como los de una dietetica (con tildes, ñ y presentaciones), las marcas siguen una distribucion
+#desigual (unas pocas marcas tienen muchos productos, como en un catalogo real) y cada producto tiene de 0 a 4
+#categorias, elegidas con mas peso para las categorias mas comunes
+#
+#Lo usa benchmarks.suite. Tambien se puede cargar en una base para probar la app a mano:
+#   python -m benchmarks.generador --url sqlite:////tmp/catalogo.db --productos 100000 --categorias 40
+#   DATABASE_URL=sqlite:////tmp/catalogo.db flask --app app run
+
+import argparse
+import itertools
+import os
+import random
+import time
+
+TIPOS= ['Harina de Almendras', 'Harina de Garbanzo', 'Harina de Arroz', 'Harina Integral', 'Aceite de Coco',
+        'Aceite de Oliva', 'Azúcar Mascabo', 'Avena Instantánea', 'Avena Arrollada', 'Té Verde', 'Té de Jengibre',
+        'Pasas de Uva', 'Maní Tostado', 'Garbanzos', 'Lentejas', 'Porotos Negros', 'Semillas de Chía',
+        'Semillas de Lino', 'Semillas de Girasol', 'Quínoa Roja', 'Quínoa Blanca', 'Leche de Almendras',
+        'Leche de Avena', 'Galletitas de Arroz', 'Galletitas de Avena', 'Miel Orgánica', 'Yerba Mate Compuesta',
+        'Nueces Peladas', 'Castañas de Cajú', 'Almendras Tostadas', 'Granola Crocante', 'Fideos de Arroz',
+        'Café de Especialidad', 'Cúrcuma Molida', 'Pimentón Ahumado', 'Levadura Nutricional', 'Proteína de Arveja',
+        'Mantequilla de Maní', 'Dátiles sin Carozo', 'Arándanos Deshidratados', 'Barritas de Cereal',
+        'Amaranto Inflado', 'Stevia Líquida', 'Sal Marina', 'Polenta Instantánea', 'Tofu Firme', 'Tahini',
+        'Cacao Amargo', 'Coco Rallado', 'Mix de Frutos Secos']
+VARIANTES= ['', '', 'Integral', 'Orgánico', 'Orgánica', 'Sin TACC', 'Light', 'Premium', 'Clásico', 'Fácil',
+            'Agroecológico', 'Sin Azúcar', 'Con Sal', 'Tostado', 'Natural']
+PRESENTACIONES= ['x 100g', 'x 250g', 'x 500g', 'x 1kg', 'x 5kg', 'x 200ml', 'x 500ml', 'x 1L', 'x 12u', '']
+MARCAS= ['Natura', 'Arcor', 'Dicomere', 'Granix', 'Molinos Ñandú', 'La Campagnola', 'Sol Azteca', 'Cabaña Ñire',
+         'Yin Yang', 'Hierbas del Oasis', 'Nutrición Pura', 'Campo Claro', 'Alimentos Güemes', 'El Almácigo',
+         'Semillas del Sur', 'Quinoa Andina', 'Doña Ángela', 'Tierra Fértil', 'Vida Sana', 'Orgánicos Patagónicos',
+         'La Chacra', 'Granos de Córdoba', 'Apícola San Martín', 'Monte Verde', 'Pachamama']
+CATEGORIAS= ['Sin TACC', 'Vegano', 'Orgánico', 'Cereales', 'Harinas', 'Frutos Secos', 'Semillas', 'Legumbres',
+             'Aceites', 'Endulzantes', 'Infusiones', 'Especias', 'Snacks', 'Lácteos Vegetales', 'Suplementos',
+             'Panificados', 'Golosinas Saludables', 'Condimentos', 'Granel', 'Keto', 'Sin Azúcar', 'Proteicos',
+             'Deshidratados', 'Congelados', 'Cosmética Natural', 'Almacén', 'Desayuno', 'Bebidas', 'Ofertas',
+             'Importados']
+#Cuantas categorias tiene un producto y con que probabilidad
+CATEGORIAS_POR_PRODUCTO= {0: 5, 1: 40, 2: 35, 3: 15, 4: 5}
+
+
+#Nombres de M categorias distintas. Si se piden mas que las de la lista se numeran ("Harinas 2")
+def nombres_categorias(cantidad):
+    return [CATEGORIAS[i % len(CATEGORIAS)] + (f' {i // len(CATEGORIAS) + 1}' if i >= len(CATEGORIAS) else '')
+            for i in range(cantidad)]
+
+#Productos como diccionarios listos para insertar (sin los campos normalizados) y las categorias de cada uno
+#(indices en nombres_categorias). Nombre y marca no se repiten (la restriccion _nombre_marca_uc)
+#La mitad de los productos tiene stock minimo (con su propio generador, asi el resto sale igual que antes)
+def generar_productos(cantidad, cantidad_categorias, semilla):
+    rnd= random.Random(semilla)
+    rnd_minimos= random.Random(semilla + 1)
+    #Zipf: la marca n tiene peso 1/n
+    pesos_marcas= [1 / (n + 1) for n in range(len(MARCAS))]
+    pesos_categorias= [1 / (n + 1) ** 0.7 for n in range(cantidad_categorias)]
+    cantidades, pesos_cantidades= zip(*CATEGORIAS_POR_PRODUCTO.items())
+    usados= set()
+
+    for _ in range(cantidad):
+        marca= rnd.choices(MARCAS, pesos_marcas)[0]
+        nombre= ' '.join(parte for parte in (rnd.choice(TIPOS), rnd.choice(VARIANTES), rnd.choice(PRESENTACIONES)) if parte)
+        #Con catalogos grandes las combinaciones se repiten: se numeran como lo haria un proveedor
+        if (nombre, marca) in usados:
+            for numero in itertools.count(2):
+                if (f'{nombre} ({numero})', marca) not in usados:
+                    nombre= f'{nombre} ({numero})'
+                    break
+        usados.add((nombre, marca))
+
+        categorias= set()
+        if cantidad_categorias:
+            k= min(rnd.choices(cantidades, pesos_cantidades)[0], cantidad_categorias)
+            while len(categorias) < k:
+                categorias.add(rnd.choices(range(cantidad_categorias), pesos_categorias)[0])
+
+        precio= round(min(max(rnd.lognormvariate(7.5, 0.8), 150), 60000), 2)
+        stock= 0 if rnd.random() < 0.1 else rnd.randint(1, 500)
+        descripcion= None if rnd.random() < 0.3 else f'{nombre} de {marca}. Producto seleccionado para dietéticas.'
+        stock_minimo= rnd_minimos.randint(1, 50) if rnd_minimos.random() < 0.5 else 0
+        yield ({'nombre': nombre, 'marca': marca, 'descripcion': descripcion, 'precio': precio, 'stock': stock,
+                'stock_minimo': stock_minimo}, sorted(categorias))
+
+#Carga el catalogo en la base de la app actual (hace falta un contexto de la app). Crea las tablas y el indice de
+#busqueda, inserta de a lotes con ids consecutivos y deja la cantidad de productos por categoria, los reportes de
+#inventario y la version del catalogo al dia. Devuelve los segundos que tardo
+def cargar_catalogo(cantidad_productos, cantidad_categorias, semilla, lote=5000):
+    from app import (db, Producto, Categoria, ResumenInventario, producto_categoria, normalizar_textos,
+                     crear_indice_busqueda, ajustar_cantidad_productos, incrementar_version_catalogo, registro_categorias,
+                     calcular_valor_por_categoria, calcular_resumen_inventario)
+
+    inicio= time.perf_counter()
+    db.create_all()
+    crear_indice_busqueda()
+    db.session.execute(db.insert(Categoria), [{'id': i + 1, 'nombre': nombre}
+                                              for i, nombre in enumerate(nombres_categorias(cantidad_categorias))])
+
+    productos, relaciones= [], []
+    cantidades= {}
+
+    def guardar():
+        if not productos:
+            return
+        nombres= normalizar_textos([datos['nombre'] for datos in productos])
+        marcas= normalizar_textos([datos['marca'] for datos in productos])
+        for datos, nombre, marca in zip(productos, nombres, marcas):
+            datos.update(nombre_normalizado=nombre or '', marca_normalizada=marca or '')
+        db.session.execute(db.insert(Producto), productos)
+        if relaciones:
+            db.session.execute(db.insert(producto_categoria), relaciones)
+        productos.clear()
+        relaciones.clear()
+
+    generados= generar_productos(cantidad_productos, cantidad_categorias, semilla)
+    for producto_id, (datos, categorias) in enumerate(generados, start=1):
+        datos['id']= producto_id
+        productos.append(datos)
+        for indice in categorias:
+            relaciones.append({'producto_id': producto_id, 'categoria_id': indice + 1})
+            cantidades[indice + 1]= cantidades.get(indice + 1, 0) + 1
+        if len(productos) >= lote:
+            guardar()
+    guardar()
+
+    ajustar_cantidad_productos(cantidades)
+    #Los reportes se calculan una vez al final, como los calcula flask reconstruir-reportes
+    valores= calcular_valor_por_categoria()
+    if valores:
+        db.session.execute(db.update(Categoria), [{'id': cat_id, 'valor_inventario': valor} for cat_id, valor in valores.items()])
+    valor_total, bajo_stock= calcular_resumen_inventario()
+    #Si la base se creo con las migraciones la fila ya existe
+    db.session.merge(ResumenInventario(id=1, valor_total=valor_total, productos_bajo_stock=bajo_stock))
+    incrementar_version_catalogo(nombres=True, categorias=True)
+    db.session.commit()
+    registro_categorias.invalidar()
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Carga un catalogo sintetico en una base nueva')
+    parser.add_argument('--url', required=True, help='Base donde cargar (por ejemplo sqlite:////tmp/catalogo.db). '
+                                                     'Tiene que estar vacia')
+    parser.add_argument('--productos', type=int, default=10000)
+    parser.add_argument('--categorias', type=int, default=30)
+    parser.add_argument('--semilla', type=int, default=42)
+    args= parser.parse_args()
+
+    #La app lee DATABASE_URL al importarse
+    os.environ['DATABASE_URL']= args.url
+    from app import app
+    with app.app_context():
+        segundos= cargar_catalogo(args.productos, args.categorias, args.semilla)
+    print(f'{args.productos} productos en {args.categorias} categorias cargados en {segundos:.1f}s')
+
+
+if __name__ == '__main__':
+    main()
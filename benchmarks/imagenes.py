@@ -0,0 +1,96 @@
+# benchmarks/imagenes.py
+#Mide la revision de la carpeta de imagenes (flask revisar-imagenes) con muchos archivos: cuanto tarda y cuanta memoria
+#usa como maximo (tracemalloc). Arma una carpeta temporal con N archivos vacios con nombre por contenido, los productos
+#que usan la mayoria y algunos productos cuya imagen no existe, y al final verifica que se encuentre exactamente lo
+#que se armo. La memoria tiene que depender del --lote, no de la cantidad de archivos
+#Usa una base SQLite y una carpeta temporales (no toca inventario.db ni static/uploads)
+#
+#   python -m benchmarks.imagenes
+#   python -m benchmarks.imagenes --archivos 500000 --lote 5000
+
+import argparse
+import hashlib
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+
+def nombre_imagen(numero):
+    return hashlib.sha256(str(numero).encode()).hexdigest() + '.jpg'
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark de la revision de la carpeta de imagenes')
+    parser.add_argument('--archivos', type=int, default=200000)
+    parser.add_argument('--huerfanos', type=float, default=0.1, help='Fraccion de archivos que ningun producto usa')
+    parser.add_argument('--faltantes', type=int, default=500, help='Productos cuya imagen no esta en la carpeta')
+    parser.add_argument('--lote', type=int, default=1000)
+    parser.add_argument('--semilla', type=int, default=42)
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        #La app lee DATABASE_URL al importarse
+        os.environ['DATABASE_URL']= 'sqlite:///' + os.path.join(carpeta, 'imagenes.db')
+        from app import app, db, Producto, archivos_huerfanos, variantes_huerfanas, referencias_rotas
+        app.config['UPLOAD_FOLDER']= os.path.join(carpeta, 'productos')
+        app.config['VARIANTES_FOLDER']= os.path.join(app.config['UPLOAD_FOLDER'], 'variantes')
+        os.makedirs(app.config['VARIANTES_FOLDER'])
+
+        inicio= time.perf_counter()
+        huerfanos= set()
+        usados= []
+        viejo= time.time() - 24 * 60 * 60
+        for numero in range(args.archivos):
+            nombre= nombre_imagen(numero)
+            path= os.path.join(app.config['UPLOAD_FOLDER'], nombre)
+            open(path, 'wb').close()
+            os.utime(path, (viejo, viejo))
+            if rnd.random() < args.huerfanos:
+                huerfanos.add(nombre)
+            else:
+                usados.append(nombre)
+        faltantes= {nombre_imagen(args.archivos + numero) for numero in range(args.faltantes)}
+
+        with app.app_context():
+            db.create_all()
+            imagenes= usados + sorted(faltantes)
+            for desde in range(0, len(imagenes), 10000):
+                db.session.execute(db.insert(Producto), [
+                    {'nombre': f'Producto {desde + i}', 'nombre_normalizado': f'producto {desde + i}', 'marca': 'Marca',
+                     'marca_normalizada': 'marca', 'precio': 1.0, 'stock': 1, 'imagen_url': nombre}
+                    for i, nombre in enumerate(imagenes[desde:desde + 10000])
+                ])
+            db.session.commit()
+            del imagenes, usados
+            print(f'{args.archivos} archivos y {args.archivos - len(huerfanos) + args.faltantes} productos '
+                  f'preparados en {time.perf_counter() - inicio:.1f}s')
+
+            #Los esperados ya estaban armados antes de empezar a medir: solo se cuenta y se compara, sin juntar resultados
+            tracemalloc.start()
+            inicio= time.perf_counter()
+            encontrados, inesperados= 0, 0
+            for nombre, _, _, _ in archivos_huerfanos(0, args.lote):
+                encontrados += 1
+                inesperados += nombre not in huerfanos
+            variantes= sum(1 for _ in variantes_huerfanas(0))
+            rotas= 0
+            for nombre in referencias_rotas(args.lote):
+                rotas += 1
+                inesperados += nombre not in faltantes
+            segundos= time.perf_counter() - inicio
+            _, pico= tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+    print(f'Revision con lote {args.lote}: {segundos:.2f}s ({args.archivos / segundos:.0f} archivos/s), '
+          f'memoria maxima {pico / 1024 / 1024:.1f} MB')
+    print(f'Archivos sin uso: {encontrados} de {len(huerfanos)}. Imagenes que faltan: {rotas} de {len(faltantes)}. '
+          f'Variantes sin original: {variantes}')
+    if inesperados or encontrados != len(huerfanos) or rotas != len(faltantes) or variantes:
+        raise SystemExit('La revision no encontro lo esperado')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# benchmarks/latencia_listado.py
+#Latencia del listado (/) mientras otros hilos modifican el stock al mismo tiempo, con cada perfil de SQLite
+#(ver PERFILES_SQLITE en app.py). Con el journal de rollback ('defecto') cada escritura frena a los lectores;
+#con WAL ('produccion') los lectores siguen leyendo mientras se escribe
+#Cada perfil corre en su propio proceso con una base SQLite temporal (no toca inventario.db)
+#
+#   python -m benchmarks.latencia_listado
+#   python -m benchmarks.latencia_listado --segundos 20 --lectores 16 --escritores 4
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+PERFILES= ('defecto', 'produccion')
+
+
+def percentil(valores, p):
+    ordenados= sorted(valores)
+    return ordenados[max(0, math.ceil(len(ordenados) * p / 100) - 1)]
+
+def resumen(latencias, errores):
+    if not latencias:
+        return {'peticiones': 0, 'errores': errores}
+    return {
+        'peticiones': len(latencias),
+        'errores': errores,
+        'p50': percentil(latencias, 50) * 1000,
+        'p95': percentil(latencias, 95) * 1000,
+        'p99': percentil(latencias, 99) * 1000,
+        'max': max(latencias) * 1000,
+    }
+
+#URLs del listado que piden los lectores: paginas, ordenes, busquedas y filtros
+def urls_listado(rnd, cantidad_categorias):
+    urls= []
+    for _ in range(200):
+        parametros= [f'page={rnd.randint(1, 40)}', f'sort_by={rnd.choice(("id", "nombre", "precio", "stock"))}',
+                     f'order={rnd.choice(("asc", "desc"))}']
+        if rnd.random() < 0.3:
+            parametros.append(f'q={rnd.choice(("harina", "avena", "mix", "natura", "aceite"))}')
+        if rnd.random() < 0.3:
+            parametros.append(f'categorias_filtro={rnd.randint(1, cantidad_categorias)}')
+        urls.append('/?' + '&'.join(parametros))
+    return urls
+
+
+#Corre en el proceso hijo: la app se importa despues de fijar DATABASE_URL y SQLITE_PERFIL
+def medir_perfil(args):
+    os.environ['DATABASE_URL']= 'sqlite:///' + args.db
+    os.environ['SQLITE_PERFIL']= args.perfil
+    from app import app, db, Producto, Categoria, producto_categoria, crear_indice_busqueda
+
+    rnd= random.Random(args.semilla)
+    palabras= ('Harina', 'Avena', 'Mix', 'Aceite', 'Semillas', 'Galletitas', 'Yerba', 'Miel')
+    marcas= ('Natura', 'Dicomere', 'Quaker', 'Arcor', 'Granix')
+    with app.app_context():
+        db.create_all()
+        crear_indice_busqueda()
+        db.session.execute(db.insert(Categoria), [{'id': i, 'nombre': f'Categoria {i}'} for i in range(1, args.categorias + 1)])
+        db.session.execute(db.insert(Producto), [
+            {'id': i, 'nombre': f'{rnd.choice(palabras)} {i}', 'nombre_normalizado': f'{rnd.choice(palabras).lower()} {i}',
+             'marca': 'x', 'marca_normalizada': rnd.choice(marcas).lower(), 'precio': rnd.uniform(100, 5000),
+             'stock': 1000000}
+            for i in range(1, args.productos + 1)
+        ])
+        db.session.execute(db.insert(producto_categoria), [
+            {'producto_id': i, 'categoria_id': c}
+            for i in range(1, args.productos + 1) for c in rnd.sample(range(1, args.categorias + 1), 2)
+        ])
+        db.session.commit()
+
+    urls= urls_listado(rnd, args.categorias)
+    lecturas, escrituras= [], []
+    errores= {'lecturas': 0, 'escrituras': 0}
+    fin= time.perf_counter() + args.segundos
+    barrera= threading.Barrier(args.lectores + args.escritores)
+
+    def lector(semilla):
+        rnd_hilo= random.Random(semilla)
+        cliente= app.test_client()
+        barrera.wait()
+        while time.perf_counter() < fin:
+            inicio= time.perf_counter()
+            respuesta= cliente.get(rnd_hilo.choice(urls))
+            lecturas.append(time.perf_counter() - inicio)
+            if respuesta.status_code != 200:
+                errores['lecturas'] += 1
+
+    def escritor(semilla):
+        rnd_hilo= random.Random(semilla)
+        cliente= app.test_client()
+        barrera.wait()
+        while time.perf_counter() < fin:
+            producto_id= rnd_hilo.randint(1, args.productos)
+            inicio= time.perf_counter()
+            respuesta= cliente.post(f'/productos/{producto_id}/stock',
+                                    json={'tipo': rnd_hilo.choice(('entrada', 'salida')), 'cantidad': 1})
+            escrituras.append(time.perf_counter() - inicio)
+            if respuesta.status_code != 201:
+                errores['escrituras'] += 1
+
+    hilos= [threading.Thread(target=lector, args=(i,)) for i in range(args.lectores)]
+    hilos+= [threading.Thread(target=escritor, args=(1000 + i,)) for i in range(args.escritores)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    print(json.dumps({'lecturas': resumen(lecturas, errores['lecturas']),
+                      'escrituras': resumen(escrituras, errores['escrituras'])}))
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Latencia del listado con escrituras concurrentes, por perfil de SQLite')
+    parser.add_argument('--segundos', type=float, default=10)
+    parser.add_argument('--lectores', type=int, default=8)
+    parser.add_argument('--escritores', type=int, default=2)
+    parser.add_argument('--productos', type=int, default=20000)
+    parser.add_argument('--categorias', type=int, default=30)
+    parser.add_argument('--semilla', type=int, default=42)
+    #Uso interno: el proceso hijo que mide un perfil
+    parser.add_argument('--perfil', choices=PERFILES, help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    args= parser.parse_args()
+
+    if args.perfil:
+        medir_perfil(args)
+        return
+
+    print(f'{args.lectores} lectores y {args.escritores} escritores durante {args.segundos:g}s, {args.productos} productos\n')
+    print(f'{"perfil":>10} {"tipo":>10} {"peticiones":>10} {"errores":>7} {"p50":>8} {"p95":>8} {"p99":>8} {"max":>8}')
+    with tempfile.TemporaryDirectory() as carpeta:
+        for perfil in PERFILES:
+            comando= [sys.executable, '-m', 'benchmarks.latencia_listado', '--perfil', perfil,
+                      '--db', os.path.join(carpeta, f'{perfil}.db'), '--segundos', str(args.segundos),
+                      '--lectores', str(args.lectores), '--escritores', str(args.escritores),
+                      '--productos', str(args.productos), '--categorias', str(args.categorias),
+                      '--semilla', str(args.semilla)]
+            proceso= subprocess.run(comando, capture_output=True, text=True)
+            if proceso.returncode != 0:
+                raise SystemExit(f'Fallo la medicion del perfil {perfil}:\n{proceso.stderr}')
+            resultado= json.loads(proceso.stdout.strip().splitlines()[-1])
+            for tipo in ('lecturas', 'escrituras'):
+                r= resultado[tipo]
+                if not r['peticiones']:
+                    print(f'{perfil:>10} {tipo:>10} {0:>10} {r["errores"]:>7}')
+                    continue
+                print(f'{perfil:>10} {tipo:>10} {r["peticiones"]:>10} {r["errores"]:>7} {r["p50"]:>6.1f}ms '
+                      f'{r["p95"]:>6.1f}ms {r["p99"]:>6.1f}ms {r["max"]:>6.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# benchmarks/normalizacion.py
+#Verifica que normalize_text (con la tabla de traduccion y el cache) de exactamente lo mismo que la version original,
+#con cientos de miles de textos al azar: nombres de productos, tildes y ñ, mayusculas, signos, espacios raros
+#(tab, espacio duro, espacios Unicode), tildes sueltas (combinantes), otros alfabetos y caracteres Unicode cualquiera
+#Despues compara la velocidad de las dos versiones con busquedas que se repiten, nombres de productos y una columna
+#entera de un archivo (normalizar_textos)
+#
+#   python -m benchmarks.normalizacion
+#   python -m benchmarks.normalizacion --casos 1000000 --semilla 7
+
+import argparse
+import random
+import re
+import sys
+import time
+import unicodedata
+
+from app import normalize_text, normalizar_textos, _normalizar_cacheado
+from benchmarks.generador import generar_productos
+
+
+#La version original de normalize_text, sin cambios, como referencia
+def normalize_text_original(text):
+    if text is None:
+        return None
+    text = text.lower()
+    text = ''.join(c for c in unicodedata.normalize('NFD', text) if unicodedata.category(c) != 'Mn')
+    text = re.sub(r'[^a-z0-9\s]', '', text)
+    text = text.strip()
+    text = re.sub(r'\s+', ' ', text)
+    if text:
+        return text
+    else:
+        return None
+
+#Caracteres con los que se arman los textos, por grupos
+ALFABETO= {
+    'ascii': [chr(c) for c in range(0x20, 0x7f)],
+    'control': [chr(c) for c in range(0x00, 0x20)] + ['\x7f'],
+    'latinos': [chr(c) for c in range(0x80, 0x250)],
+    'espacios': [' ', '\t', '\n', '\r', '\x0b', '\x0c', '\x1c', '\x1f', '\x85', '\xa0', '\u1680', '\u2003', '\u2009',
+                 '\u200b', '\u2028', '\u202f', '\u205f', '\u3000', '\ufeff'],
+    'combinantes': [chr(c) for c in range(0x300, 0x370)] + ['\u0483', '\u0903', '\u20dd', '\u1ab0'],
+    #Casos especiales: "İ" en minuscula son dos caracteres, "K" de Kelvin, el signo de pregunta griego (se descompone
+    #en ";"), la "ﬁ" ligada, superindices, numeros de otros alfabetos, emojis
+    'especiales': ['İ', '\u212a', '\u212b', '\u037e', 'ﬁ', '²', '½', '٣', '৩', 'Ⅻ',
+                   'ẞ', 'ß', 'Σ', 'ς', 'ǅ', '\U0001f642', '\U0001f44d\U0001f3fd'],
+    'otros': ['ж', 'Ω', 'λ', 'م', 'ש', 'ह', 'ไ', '日', '한', 'ế',
+              'ữ', 'ạ', 'ǘ', 'ḉ'],
+}
+PESOS= {'ascii': 60, 'control': 1, 'latinos': 20, 'espacios': 6, 'combinantes': 4, 'especiales': 3, 'otros': 6}
+
+def texto_al_azar(rnd):
+    #Uno de cada diez es cualquier caracter Unicode (de todos los planos)
+    if rnd.random() < 0.1:
+        return ''.join(chr(rnd.randint(0, 0x10ffff)) for _ in range(rnd.randint(0, 12))
+                       ).encode('utf-8', 'surrogatepass').decode('utf-8', 'replace')
+    grupos= list(PESOS)
+    return ''.join(rnd.choice(ALFABETO[rnd.choices(grupos, [PESOS[g] for g in grupos])[0]])
+                   for _ in range(rnd.randint(0, 40)))
+
+def verificar(casos, semilla):
+    rnd= random.Random(semilla)
+    textos= [texto_al_azar(rnd) for _ in range(casos)]
+    #Nombres y marcas como los de un catalogo real, y algunos cambiados de mayusculas y espacios
+    for datos, _ in generar_productos(casos // 10, 0, semilla):
+        textos.append(datos['nombre'])
+        textos.append(f'  {datos["marca"].upper()}\t {datos["nombre"]}  ')
+    textos+= ['', ' ', None, '¿?', 'Ñ', 'a\u0301', '\u0301a']
+
+    diferencias= []
+    for text in textos:
+        esperado= normalize_text_original(text)
+        #Dos veces: la segunda sale del cache
+        if normalize_text(text) != esperado or normalize_text(text) != esperado:
+            diferencias.append((text, esperado, normalize_text(text)))
+    if normalizar_textos(textos) != [normalize_text_original(text) for text in textos]:
+        diferencias.append(('normalizar_textos', None, None))
+    return len(textos), diferencias
+
+def medir(funcion, textos, repeticiones):
+    mejor= None
+    for _ in range(repeticiones):
+        inicio= time.perf_counter()
+        funcion(textos)
+        segundos= time.perf_counter() - inicio
+        mejor= segundos if mejor is None else min(mejor, segundos)
+    return mejor
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Equivalencia y velocidad de normalize_text')
+    parser.add_argument('--casos', type=int, default=200000, help='Textos al azar para la verificacion')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--repeticiones', type=int, default=5)
+    args= parser.parse_args()
+
+    cantidad, diferencias= verificar(args.casos, args.semilla)
+    if diferencias:
+        for text, esperado, obtenido in diferencias[:20]:
+            print(f'  DIFERENCIA {text!r}: original {esperado!r}, nueva {obtenido!r}')
+        print(f'{len(diferencias)} diferencias en {cantidad} textos')
+        sys.exit(1)
+    print(f'{cantidad} textos: normalize_text da lo mismo que la version original\n')
+
+    rnd= random.Random(args.semilla)
+    nombres= [datos['nombre'] for datos, _ in generar_productos(50000, 0, args.semilla)]
+    marcas= [datos['marca'] for datos, _ in generar_productos(50000, 0, args.semilla)]
+    busquedas= [rnd.choice(('almendras', 'Harina de Garbanzo', 'té verde', 'sin tacc', 'ÑANDÚ', 'quinoa', 'mix'))
+                for _ in range(50000)]
+    casos= [
+        ('busquedas repetidas', busquedas),
+        ('nombres de productos', nombres),
+        ('marcas (columna de un archivo)', marcas),
+    ]
+
+    print(f'{"caso":<32} {"textos":>7} {"original":>10} {"nueva":>10} {"lote":>10}')
+    for nombre, textos in casos:
+        original= medir(lambda t: [normalize_text_original(x) for x in t], textos, args.repeticiones)
+
+        def nueva(t):
+            _normalizar_cacheado.cache_clear()
+            return [normalize_text(x) for x in t]
+        rapida= medir(nueva, textos, args.repeticiones)
+        lote= medir(normalizar_textos, textos, args.repeticiones)
+        print(f'{nombre:<32} {len(textos):>7} {original * 1000:>8.1f}ms {rapida * 1000:>8.1f}ms {lote * 1000:>8.1f}ms'
+              f'   x{original / rapida:.1f} / x{original / lote:.1f}')
+
+
+if __name__ == '__main__':
+    main()
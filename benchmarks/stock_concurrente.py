@@ -0,0 +1,176 @@
+# benchmarks/stock_concurrente.py
+#Prueba de carga de los movimientos de stock: muchos hilos haciendo entradas y salidas sobre pocos productos a la vez
+#Al final verifica que no se perdio ningun movimiento: el stock de cada producto tiene que ser el inicial mas las
+#entradas menos las salidas que se aplicaron, la version tiene que haber subido una vez por movimiento, y el historial
+#(movimiento_stock) tiene que poder reproducirse paso a paso sin que el stock quede nunca negativo
+#Para comparar, hace lo mismo leyendo el stock y escribiendo el valor calculado (como el form de edicion) y cuenta
+#cuantos movimientos se pierden de esa forma
+#Usa una base SQLite temporal (no toca inventario.db). Con --url corre contra otra base, por ejemplo un PostgreSQL local
+#de prueba: sus tablas se borran y se vuelven a crear
+#
+#   python -m benchmarks.stock_concurrente
+#   python -m benchmarks.stock_concurrente --hilos 32 --movimientos 100 --productos 3
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from flask import Flask
+
+from app import db, Producto, MovimientoStock, mover_stock
+
+
+def crear_app(url, productos, stock_inicial):
+    #Una app aparte con la misma db y los mismos modelos, apuntando a la base temporal
+    app_prueba= Flask('stock_concurrente')
+    app_prueba.config['SQLALCHEMY_DATABASE_URI']= url
+    db.init_app(app_prueba)
+    with app_prueba.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.execute(db.insert(Producto), [
+            {'id': i, 'nombre': f'Producto {i}', 'nombre_normalizado': f'producto {i}', 'marca': 'Marca',
+             'marca_normalizada': 'marca', 'precio': 1.0, 'stock': stock_inicial}
+            for i in range(1, productos + 1)
+        ])
+        db.session.commit()
+    return app_prueba
+
+def generar_movimientos(rnd, hilos, movimientos, productos):
+    #Un poco mas de salidas que de entradas para que el control de stock negativo tambien se ejercite
+    return [
+        [(rnd.randint(1, productos), rnd.choice(('entrada', 'salida', 'salida')), rnd.randint(1, 5))
+         for _ in range(movimientos)]
+        for _ in range(hilos)
+    ]
+
+#Como se cambiaba el stock antes: leer, calcular en Python y escribir el resultado (dos transacciones)
+def mover_stock_ingenuo(producto_id, tipo, cantidad):
+    stock= db.session.get(Producto, producto_id).stock
+    db.session.commit()
+    #La pausa entre leer y escribir es la de una persona completando el form
+    time.sleep(0.001)
+    nuevo= stock + cantidad if tipo == 'entrada' else stock - cantidad
+    if nuevo < 0:
+        return None, (409, 'Stock insuficiente')
+    db.session.execute(db.update(Producto).where(Producto.id == producto_id).values(stock=nuevo))
+    db.session.commit()
+    return {}, None
+
+def correr(app_prueba, movimientos_por_hilo, funcion):
+    aplicados= []
+    errores= []
+    barrera= threading.Barrier(len(movimientos_por_hilo))
+
+    def trabajador(movimientos):
+        with app_prueba.app_context():
+            barrera.wait()  #Arrancan todos juntos
+            for producto_id, tipo, cantidad in movimientos:
+                _, error= funcion(producto_id, tipo, cantidad)
+                if error is None:
+                    aplicados.append((producto_id, tipo, cantidad))
+                else:
+                    errores.append(error)
+            db.session.remove()
+
+    hilos= [threading.Thread(target=trabajador, args=(m,)) for m in movimientos_por_hilo]
+    inicio= time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    return aplicados, errores, time.perf_counter() - inicio
+
+def esperado_por_producto(aplicados, productos, stock_inicial):
+    stock= {i: stock_inicial for i in range(1, productos + 1)}
+    cantidad= {i: 0 for i in range(1, productos + 1)}
+    for producto_id, tipo, valor in aplicados:
+        stock[producto_id] += valor if tipo == 'entrada' else -valor
+        cantidad[producto_id] += 1
+    return stock, cantidad
+
+#Devuelve la lista de problemas encontrados (vacia si todo cierra)
+def verificar(app_prueba, aplicados, productos, stock_inicial):
+    stock_esperado, movimientos_esperados= esperado_por_producto(aplicados, productos, stock_inicial)
+    problemas= []
+    with app_prueba.app_context():
+        for producto in Producto.query.order_by(Producto.id):
+            if producto.stock != stock_esperado[producto.id]:
+                problemas.append(f'producto {producto.id}: stock {producto.stock}, esperado {stock_esperado[producto.id]}')
+            if producto.version != 1 + movimientos_esperados[producto.id]:
+                problemas.append(f'producto {producto.id}: version {producto.version}, '
+                                 f'esperada {1 + movimientos_esperados[producto.id]}')
+
+            #Reproducimos el historial del producto en el orden en que se registro
+            stock= stock_inicial
+            historial= MovimientoStock.query.filter_by(producto_id=producto.id).order_by(MovimientoStock.id).all()
+            for movimiento in historial:
+                stock += movimiento.cantidad if movimiento.tipo == 'entrada' else -movimiento.cantidad
+                if stock < 0 or stock != movimiento.stock_resultante:
+                    problemas.append(f'producto {producto.id}: el historial no cierra en el movimiento {movimiento.id}')
+                    break
+            if len(historial) != movimientos_esperados[producto.id]:
+                problemas.append(f'producto {producto.id}: {len(historial)} movimientos registrados, '
+                                 f'esperados {movimientos_esperados[producto.id]}')
+    return problemas
+
+#Dos movimientos que esperan la misma version: el segundo tiene que ser rechazado
+def verificar_version(app_prueba):
+    with app_prueba.app_context():
+        version= db.session.get(Producto, 1).version
+        db.session.commit()
+        _, primero= mover_stock(1, 'entrada', 1, version_esperada=version)
+        _, segundo= mover_stock(1, 'entrada', 1, version_esperada=version)
+        return primero is None and segundo is not None and segundo[0] == 409
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Prueba de concurrencia de los movimientos de stock')
+    parser.add_argument('--hilos', type=int, default=16)
+    parser.add_argument('--movimientos', type=int, default=50, help='Movimientos por hilo')
+    parser.add_argument('--productos', type=int, default=5)
+    parser.add_argument('--stock-inicial', type=int, default=100)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--url', help='Base de prueba (por ejemplo postgresql://localhost/prueba_stock). Se borran sus tablas')
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+    movimientos= generar_movimientos(rnd, args.hilos, args.movimientos, args.productos)
+    total= args.hilos * args.movimientos
+    print(f'{args.hilos} hilos x {args.movimientos} movimientos sobre {args.productos} productos ({total} movimientos)\n')
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        app_atomica= crear_app(args.url or 'sqlite:///' + os.path.join(carpeta, 'atomico.db'), args.productos, args.stock_inicial)
+        aplicados, errores, segundos= correr(app_atomica, movimientos, mover_stock)
+        rechazos= sum(1 for codigo, _ in errores if codigo == 409)
+        print(f'mover_stock:  {len(aplicados)} aplicados, {rechazos} rechazados por falta de stock, '
+              f'{len(errores) - rechazos} otros errores, {total / segundos:.0f} movimientos/s')
+        problemas= verificar(app_atomica, aplicados, args.productos, args.stock_inicial)
+        if len(errores) != rechazos:
+            problemas.append(f'{len(errores) - rechazos} movimientos fallaron por otro motivo: {errores[:3]}')
+        if not verificar_version(app_atomica):
+            problemas.append('un movimiento con una version vieja no fue rechazado')
+
+        app_ingenua= crear_app(args.url or 'sqlite:///' + os.path.join(carpeta, 'ingenuo.db'), args.productos, args.stock_inicial)
+        aplicados_ingenuo, _, segundos= correr(app_ingenua, movimientos, mover_stock_ingenuo)
+        stock_esperado, _= esperado_por_producto(aplicados_ingenuo, args.productos, args.stock_inicial)
+        with app_ingenua.app_context():
+            diferencia= sum(abs(p.stock - stock_esperado[p.id]) for p in Producto.query)
+        print(f'leer y escribir: {len(aplicados_ingenuo)} "aplicados", el stock final difiere en {diferencia} unidades '
+              f'de lo esperado, {total / segundos:.0f} movimientos/s')
+
+        for app_prueba in (app_atomica, app_ingenua):
+            with app_prueba.app_context():
+                db.engine.dispose()
+
+    if problemas:
+        for problema in problemas:
+            print(f'  ERROR {problema}')
+        raise SystemExit(1)
+    print('\nmover_stock no perdio ningun movimiento y el historial coincide con el stock final.')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/stock_lote.py
+#Mide cuantas lineas por segundo aplica mover_stock_lote (sincronizacion de los puntos de venta) contra aplicar
+#las mismas lineas de a una con mover_stock. Al final verifica que el stock y el historial coincidan con las lineas
+#que el reporte dio por aplicadas
+#Usa una base SQLite temporal (no toca inventario.db). Con --url corre contra otra base, por ejemplo un PostgreSQL local
+#de prueba: sus tablas se borran y se vuelven a crear
+#
+#   python -m benchmarks.stock_lote
+#   python -m benchmarks.stock_lote --productos 50000 --lineas 100000 --lote 5000
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from flask import Flask
+
+from app import db, Producto, MovimientoStock, mover_stock, mover_stock_lote
+
+
+def crear_app(url, productos, stock_inicial):
+    app_prueba= Flask('stock_lote')
+    app_prueba.config['SQLALCHEMY_DATABASE_URI']= url
+    db.init_app(app_prueba)
+    with app_prueba.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.execute(db.insert(Producto), [
+            {'id': i, 'nombre': f'Producto {i}', 'nombre_normalizado': f'producto {i}', 'marca': 'Marca',
+             'marca_normalizada': 'marca', 'precio': 1.0, 'stock': stock_inicial}
+            for i in range(1, productos + 1)
+        ])
+        db.session.commit()
+    return app_prueba
+
+#Casi todas las lineas son ventas. Una de cada cinco viene por nombre y marca en vez de id,
+#y algunas apuntan a productos que no existen
+def generar_lineas(rnd, cantidad, productos):
+    lineas= []
+    for _ in range(cantidad):
+        producto_id= rnd.randint(1, productos + productos // 100)
+        delta= rnd.choice((-1, -1, -2, -3, 5))
+        if rnd.random() < 0.2:
+            lineas.append({'nombre': f'Producto {producto_id}', 'marca': 'Marca', 'delta': delta})
+        else:
+            lineas.append({'producto_id': producto_id, 'delta': delta})
+    return lineas
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark de movimientos de stock por lote')
+    parser.add_argument('--productos', type=int, default=10000)
+    parser.add_argument('--lineas', type=int, default=50000)
+    parser.add_argument('--lote', type=int, default=1000, help='Lineas por lote')
+    parser.add_argument('--sueltos', type=int, default=2000, help='Lineas a aplicar de a una para comparar')
+    parser.add_argument('--stock-inicial', type=int, default=20)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--url', help='Base de prueba (por ejemplo postgresql://localhost/prueba_stock). Se borran sus tablas')
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+    lineas= generar_lineas(rnd, args.lineas, args.productos)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        app_prueba= crear_app(args.url or 'sqlite:///' + os.path.join(carpeta, 'lote.db'), args.productos, args.stock_inicial)
+        with app_prueba.app_context():
+            aplicadas= 0
+            fallidas= 0
+            deltas_aplicados= {}
+            inicio= time.perf_counter()
+            for desde in range(0, len(lineas), args.lote):
+                lote= lineas[desde:desde + args.lote]
+                reporte= mover_stock_lote(lote)
+                aplicadas += reporte['aplicadas']
+                fallidas += len(reporte['fallidas'])
+                indices_fallidos= {indice for indice, _ in reporte['fallidas']}
+                for indice, linea in enumerate(lote):
+                    if indice not in indices_fallidos:
+                        producto_id= linea.get('producto_id') or int(linea['nombre'].rsplit(' ', 1)[1])
+                        deltas_aplicados[producto_id]= deltas_aplicados.get(producto_id, 0) + linea['delta']
+            segundos= time.perf_counter() - inicio
+            print(f'mover_stock_lote: {len(lineas)} lineas en lotes de {args.lote}: {aplicadas} aplicadas, {fallidas} fallidas, '
+                  f'{segundos:.2f}s, {len(lineas) / segundos:.0f} lineas/s')
+
+            #Verificacion: stock final = inicial + lo aplicado, nunca negativo, y una fila de historial por linea aplicada
+            problemas= 0
+            for producto_id, stock in db.session.execute(db.select(Producto.id, Producto.stock)):
+                esperado= args.stock_inicial + deltas_aplicados.get(producto_id, 0)
+                if stock != esperado or stock < 0:
+                    problemas += 1
+            movimientos= db.session.execute(db.select(db.func.count()).select_from(MovimientoStock)).scalar()
+            if movimientos != aplicadas:
+                problemas += 1
+            if problemas:
+                raise SystemExit(f'{problemas} diferencias entre el stock y las lineas aplicadas')
+
+            #Las mismas lineas de a una (solo por id), cada una con su transaccion
+            sueltas= [linea for linea in lineas if 'producto_id' in linea][:args.sueltos]
+            inicio= time.perf_counter()
+            for linea in sueltas:
+                tipo= 'entrada' if linea['delta'] > 0 else 'salida'
+                mover_stock(linea['producto_id'], tipo, abs(linea['delta']))
+            segundos_sueltos= time.perf_counter() - inicio
+            print(f'mover_stock de a una: {len(sueltas)} lineas, {segundos_sueltos:.2f}s, '
+                  f'{len(sueltas) / segundos_sueltos:.0f} lineas/s')
+            db.engine.dispose()
+
+    print('\nEl stock final y el historial coinciden con las lineas aplicadas.')
+
+
+if __name__ == '__main__':
+    main()
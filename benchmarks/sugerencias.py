@@ -0,0 +1,112 @@
+# benchmarks/sugerencias.py
+#Mide el indice de sugerencias del buscador (/api/v1/sugerencias): cuanto tarda en armarse, cuanta memoria usa
+#(tracemalloc) y la latencia (p50/p99/max) de cada busqueda, con lo que se escribe letra por letra en el buscador
+#Verifica resultados al azar contra una busqueda de fuerza bruta sobre todos los productos
+#Usa una base SQLite temporal con el catalogo de benchmarks/generador.py (no toca inventario.db)
+#
+#   python -m benchmarks.sugerencias
+#   python -m benchmarks.sugerencias --productos 100000 --limite 8
+
+import argparse
+import math
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.generador import cargar_catalogo, TIPOS, MARCAS
+
+
+def percentil(ordenados, p):
+    return ordenados[max(0, math.ceil(len(ordenados) * p / 100) - 1)]
+
+#Lo que se escribe en el buscador: cada prefijo de un nombre o una marca, y de "palabra marca" (palabras sueltas)
+def consultas(normalize_text, cantidad, rnd):
+    textos= [normalize_text(t) for t in TIPOS + MARCAS]
+    resultado= []
+    while len(resultado) < cantidad:
+        texto= rnd.choice(textos)
+        if rnd.random() < 0.3:
+            texto= f'{rnd.choice(texto.split())} {rnd.choice(textos).split()[0]}'
+        for fin in range(1, len(texto) + 1):
+            if texto[:fin].strip():
+                resultado.append(texto[:fin].strip())
+    return resultado[:cantidad]
+
+#La misma busqueda que IndiceSugerencias.buscar recorriendo todos los productos
+def fuerza_bruta(productos, consulta, limite):
+    terminos= consulta.split()
+    orden= sorted(productos, key=lambda p: (p[3], p[4], p[0]))
+    primeros= [p for p in orden if p[3].startswith(consulta)][:limite]
+    ids= {p[0] for p in primeros}
+    resto= [p for p in orden if p[0] not in ids
+            and all(f' {t}' in f' {p[3]} {p[4]}' for t in terminos)]
+    #Los que coinciden por palabras no salen siempre en orden alfabetico (ver IndiceSugerencias.buscar): se compara que
+    #sean de los esperados y que sean tantos como se puede
+    return [p[0] for p in primeros], {p[0] for p in resto}
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark del indice de sugerencias del buscador')
+    parser.add_argument('--productos', type=int, default=50000)
+    parser.add_argument('--categorias', type=int, default=30)
+    parser.add_argument('--consultas', type=int, default=20000)
+    parser.add_argument('--verificar', type=int, default=300, help='Consultas que se comparan con la fuerza bruta')
+    parser.add_argument('--limite', type=int, default=10)
+    parser.add_argument('--semilla', type=int, default=42)
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        #La app lee DATABASE_URL al importarse
+        os.environ['DATABASE_URL']= 'sqlite:///' + os.path.join(carpeta, 'sugerencias.db')
+        from app import app, db, Producto, normalize_text, indice_sugerencias, version_nombres_catalogo
+
+        with app.app_context():
+            segundos= cargar_catalogo(args.productos, args.categorias, args.semilla)
+            print(f'{args.productos} productos cargados en {segundos:.1f}s')
+
+            inicio= time.perf_counter()
+            datos= indice_sugerencias.armar(version_nombres_catalogo())
+            armado= time.perf_counter() - inicio
+            indice_sugerencias.datos= datos
+            #La memoria se mide armandolo otra vez: con tracemalloc activo armar tarda varias veces mas
+            tracemalloc.start()
+            copia= indice_sugerencias.armar(version_nombres_catalogo())
+            memoria, _= tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del copia
+            version= datos[0]
+            print(f'Indice armado en {armado * 1000:.0f}ms: {len(datos[2])} nombres, {len(datos[4])} palabras, '
+                  f'{memoria / 1024 / 1024:.1f} MB')
+
+            lista= consultas(normalize_text, args.consultas, rnd)
+            tiempos= []
+            for consulta in lista:
+                inicio= time.perf_counter()
+                indice_sugerencias.buscar(consulta, args.limite, version)
+                tiempos.append(time.perf_counter() - inicio)
+            tiempos.sort()
+            print(f'{len(lista)} busquedas: p50 {percentil(tiempos, 50) * 1e6:.0f}us, '
+                  f'p99 {percentil(tiempos, 99) * 1e6:.0f}us, max {tiempos[-1] * 1e6:.0f}us')
+
+            productos= [tuple(fila) for fila in db.session.execute(db.select(
+                Producto.id, Producto.nombre, Producto.marca, Producto.nombre_normalizado, Producto.marca_normalizada))]
+            errores= 0
+            for consulta in rnd.sample(lista, min(args.verificar, len(lista))):
+                ids= [s['id'] for s in indice_sugerencias.buscar(consulta, args.limite, version)]
+                primeros, resto= fuerza_bruta(productos, consulta, args.limite)
+                esperados_resto= min(len(resto), args.limite - len(primeros))
+                if ids[:len(primeros)] != primeros or not set(ids[len(primeros):]) <= resto \
+                        or len(ids) - len(primeros) != esperados_resto:
+                    errores += 1
+                    print(f'Distinto para {consulta!r}: {ids} (esperados {primeros} y {esperados_resto} de {len(resto)})')
+            print(f'Verificadas {min(args.verificar, len(lista))} busquedas contra la fuerza bruta: {errores} distintas')
+
+    if errores:
+        raise SystemExit('El indice no devolvio lo mismo que la fuerza bruta')
+
+
+if __name__ == '__main__':
+    main()
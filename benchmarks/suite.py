@@ -0,0 +1,212 @@
+# benchmarks/suite.py
+#Mide las operaciones principales de la app sobre un catalogo sintetico (benchmarks.generador) y guarda los resultados
+#en JSON, para poder comparar corridas entre commits:
+#   busqueda, filtros por categorias AND / OR, cada columna de orden (asc y desc), paginacion profunda (por numero de
+#   pagina y por cursor), listado desde el cache, reporte de inventario, agregar / editar / eliminar productos y la
+#   verificacion al eliminar una categoria con productos
+#Cada operacion se hace por HTTP con el cliente de pruebas de Flask. Antes de cada peticion se vacian los caches del
+#listado (salvo en "listado_cacheado"), asi se mide el trabajo real y no el cache
+#Usa una base SQLite temporal (no toca inventario.db)
+#
+#   python -m benchmarks.suite
+#   python -m benchmarks.suite --productos 100000 --categorias 40 --repeticiones 30
+#   python -m benchmarks.suite --salida antes.json && ... && python -m benchmarks.suite --comparar antes.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from benchmarks.generador import cargar_catalogo, TIPOS, MARCAS
+
+
+BUSQUEDAS= ['almendra', 'harina garbanzo', 'té verde', 'ñandu', 'organico', 'quinoa roja', 'zzz']
+CARPETA_RESULTADOS= os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+
+def commit_actual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+#Cada operacion es una funcion que recibe el numero de repeticion y hace UNA peticion. Devuelve la respuesta
+def operaciones(app, cliente, cliente_escritura, args, rnd):
+    from app import db, Producto, COLUMNAS_ORDENABLES, codificar_cursor
+
+    por_pagina= app.config['PRODUCTOS_POR_PAGINA']
+    ultima_pagina= max(1, args.productos // por_pagina)
+    with app.app_context():
+        #Cursor de una pagina cerca del final, ordenando por nombre
+        nombre, producto_id= db.session.execute(
+            db.select(Producto.nombre_normalizado, Producto.id).order_by(Producto.nombre_normalizado, Producto.id)
+            .offset(max(0, args.productos - por_pagina * 2)).limit(1)
+        ).one()
+        cursor_profundo= codificar_cursor([nombre, producto_id])
+
+    def categorias_al_azar(cantidad):
+        return '&'.join(f'categorias_filtro={c}' for c in rnd.sample(range(1, args.categorias + 1), cantidad))
+
+    def get(url):
+        return lambda n: cliente.get(url() if callable(url) else url)
+
+    lista= [('busqueda', get(lambda: '/?q=' + rnd.choice(BUSQUEDAS)))]
+    lista.append(('filtro_and', get(lambda: f'/?logic_type=and&{categorias_al_azar(2)}')))
+    lista.append(('filtro_or', get(lambda: f'/?logic_type=or&{categorias_al_azar(3)}')))
+    for columna in COLUMNAS_ORDENABLES:
+        for orden in ('asc', 'desc'):
+            lista.append((f'orden_{columna}_{orden}', get(f'/?sort_by={columna}&order={orden}')))
+    lista.append(('pagina_profunda', get(f'/?sort_by=nombre&page={ultima_pagina}')))
+    lista.append(('cursor_profundo', get(f'/?sort_by=nombre&paginacion=keyset&despues={cursor_profundo}')))
+    lista.append(('listado_cacheado', get('/?sort_by=precio&order=desc')))
+    lista.append(('reporte_inventario', get('/reportes')))
+
+    agregados= []
+
+    def agregar(n):
+        respuesta= cliente_escritura.post('/agregar_producto', data={
+            'nombre': f'{rnd.choice(TIPOS)} Benchmark {n}', 'marca': rnd.choice(MARCAS), 'precio': '1234.5',
+            'stock': '10', 'categorias': [str(c) for c in rnd.sample(range(1, args.categorias + 1), 2)],
+        })
+        with app.app_context():
+            agregados.append(db.session.execute(db.select(db.func.max(Producto.id))).scalar())
+        return respuesta
+
+    def editar(n):
+        producto_id= rnd.randint(1, args.productos)
+        with app.app_context():
+            producto= db.session.get(Producto, producto_id)
+            datos= {'nombre': producto.nombre, 'marca': producto.marca, 'descripcion': producto.descripcion or '',
+                    'precio': str(producto.precio + 1), 'stock': str(producto.stock + 1),
+                    'categorias': [str(c) for c in rnd.sample(range(1, args.categorias + 1), 2)]}
+        return cliente_escritura.post(f'/editar_producto/{producto_id}', data=datos)
+
+    def eliminar(n):
+        return cliente_escritura.post(f'/eliminar_producto/{agregados.pop()}')
+
+    #Reajuste de una marca entera: la vista previa solo lee, el otro es el UPDATE con el historial y los reportes
+    def reajuste(vista_previa):
+        def operacion(n):
+            datos= {'tipo': 'porcentaje', 'valor': '1', 'marca': rnd.choice(MARCAS[:5]), 'logica': 'or'}
+            datos['vista_previa' if vista_previa else 'submit']= 'x'
+            return cliente_escritura.post('/reajustar_precios', data=datos)
+        return operacion
+
+    def eliminar_categoria_con_productos(n):
+        return cliente_escritura.post('/eliminar_categoria/1')
+
+    lista+= [('agregar_producto', agregar), ('editar_producto', editar), ('eliminar_producto', eliminar),
+             ('reajuste_vista_previa', reajuste(True)), ('reajuste_marca', reajuste(False)),
+             ('eliminar_categoria_con_productos', eliminar_categoria_con_productos)]
+    return lista
+
+def medir(app, nombre, operacion, repeticiones):
+    from app import contar_consultas, percentil, _cache_paginas_listado, _cache_fragmentos_listado
+
+    tiempos, consultas, errores= [], [], 0
+    for n in range(repeticiones):
+        if nombre != 'listado_cacheado':
+            _cache_paginas_listado.limpiar()
+            _cache_fragmentos_listado.limpiar()
+        with app.app_context(), contar_consultas() as contador:
+            inicio= time.perf_counter()
+            respuesta= operacion(n)
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        consultas.append(contador['consultas'])
+        if respuesta.status_code not in (200, 302):
+            errores += 1
+    ordenados= sorted(tiempos)
+    return {
+        'repeticiones': repeticiones,
+        'errores': errores,
+        'p50_ms': percentil(ordenados, 50),
+        'p95_ms': percentil(ordenados, 95),
+        'media_ms': statistics.fmean(tiempos),
+        'min_ms': ordenados[0],
+        'max_ms': ordenados[-1],
+        'consultas': statistics.median(consultas),
+    }
+
+def comparar(anterior, actual):
+    print(f'\nComparado con {anterior.get("commit") or "?"} ({anterior["fecha"]}), p50 en ms:')
+    print(f'{"operacion":<34} {"antes":>9} {"ahora":>9} {"cambio":>8}')
+    for nombre, resultado in actual['operaciones'].items():
+        previo= anterior['operaciones'].get(nombre)
+        if previo is None:
+            print(f'{nombre:<34} {"-":>9} {resultado["p50_ms"]:>9.2f}')
+            continue
+        cambio= (resultado['p50_ms'] / previo['p50_ms'] - 1) * 100 if previo['p50_ms'] else 0
+        print(f'{nombre:<34} {previo["p50_ms"]:>9.2f} {resultado["p50_ms"]:>9.2f} {cambio:>+7.0f}%')
+
+
+def main():
+    parser= argparse.ArgumentParser(description='Benchmark de las operaciones principales sobre un catalogo sintetico')
+    parser.add_argument('--productos', type=int, default=20000)
+    parser.add_argument('--categorias', type=int, default=30)
+    parser.add_argument('--repeticiones', type=int, default=20, help='Peticiones por operacion')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--salida', help='Archivo JSON de resultados (por defecto benchmarks/resultados/<commit>.json)')
+    parser.add_argument('--comparar', help='Resultados de otra corrida para comparar')
+    args= parser.parse_args()
+    rnd= random.Random(args.semilla)
+    commit= commit_actual()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        #La app lee la configuracion al importarse: base y log de consultas lentas temporales
+        os.environ['DATABASE_URL']= 'sqlite:///' + os.path.join(carpeta, 'suite.db')
+        os.environ['CONSULTAS_LENTAS_LOG']= os.path.join(carpeta, 'consultas_lentas.log')
+        from app import app, db
+        app.config['WTF_CSRF_ENABLED']= False
+
+        with app.app_context():
+            carga= cargar_catalogo(args.productos, args.categorias, args.semilla)
+        print(f'{args.productos} productos en {args.categorias} categorias, cargados en {carga:.1f}s\n')
+
+        resultados= {}
+        print(f'{"operacion":<34} {"p50":>9} {"p95":>9} {"max":>9} {"consultas":>9}')
+        lista= operaciones(app, app.test_client(), app.test_client(), args, rnd)
+        for nombre, operacion in lista:
+            resultado= medir(app, nombre, operacion, args.repeticiones)
+            resultados[nombre]= resultado
+            errores= f'  ({resultado["errores"]} errores)' if resultado['errores'] else ''
+            print(f'{nombre:<34} {resultado["p50_ms"]:>7.2f}ms {resultado["p95_ms"]:>7.2f}ms '
+                  f'{resultado["max_ms"]:>7.2f}ms {resultado["consultas"]:>9g}{errores}')
+        with app.app_context():
+            db.engine.dispose()
+
+    salida= {
+        'fecha': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'parametros': {'productos': args.productos, 'categorias': args.categorias,
+                       'repeticiones': args.repeticiones, 'semilla': args.semilla},
+        'carga_segundos': carga,
+        'operaciones': resultados,
+    }
+    path= args.salida
+    if not path:
+        os.makedirs(CARPETA_RESULTADOS, exist_ok=True)
+        path= os.path.join(CARPETA_RESULTADOS, f'{commit or "sin-commit"}.json')
+    with open(path, 'w', encoding='utf-8') as archivo:
+        json.dump(salida, archivo, indent=2, ensure_ascii=False)
+    print(f'\nResultados en {path}')
+
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as archivo:
+            comparar(json.load(archivo), salida)
+    if any(resultado['errores'] for resultado in resultados.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# explain_listado.py
+#Imprime el EXPLAIN QUERY PLAN de cada forma de consulta que puede hacer el listado (inicio)
+#Sirve para ver de un vistazo si alguna consulta dejo de usar los indices ("SCAN producto" en vez de "SEARCH ... USING INDEX")
+#
+#   python explain_listado.py
+
+from app import (app, db, Producto, filtrar_productos, ordenar_productos, condicion_keyset,
+                 COLUMNAS_ORDENABLES)
+
+
+#Compila la consulta con los parametros del dialecto actual y le pide el plan a la DB
+def imprimir_plan(titulo, statement):
+    compilada= statement.compile(dialect=db.engine.dialect, compile_kwargs={'render_postcompile': True})
+    prefijo= 'EXPLAIN QUERY PLAN ' if db.engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    #SQLite usa parametros posicionales (?), los pasamos en el orden en que aparecen
+    if compilada.positiontup:
+        parametros= tuple(compilada.params[nombre] for nombre in compilada.positiontup)
+    else:
+        parametros= compilada.params
+    filas= db.session.connection().exec_driver_sql(prefijo + str(compilada), parametros).fetchall()
+
+    print(f'\n=== {titulo} ===')
+    for fila in filas:
+        #En SQLite la ultima columna es el detalle del paso ("SEARCH producto USING INDEX ...")
+        print(f'  {fila[-1]}')
+
+
+with app.app_context():
+    per_page= app.config['PRODUCTOS_POR_PAGINA']
+
+    #Combinaciones de busqueda y filtro por categorias que puede recibir inicio
+    filtros= [
+        ('sin filtros', None, [], 'and'),
+        ('busqueda', 'harina', [], 'and'),
+        ('categorias AND', None, [1, 2], 'and'),
+        ('categorias OR', None, [1, 2], 'or'),
+        ('busqueda + categorias AND', 'harina', [1, 2], 'and'),
+    ]
+
+    for nombre_filtro, busqueda, categorias, logica in filtros:
+        filtrado= filtrar_productos(busqueda, categorias, logica)
+
+        #El COUNT que hace paginate()
+        imprimir_plan(f'{nombre_filtro} | COUNT',
+                      db.select(db.func.count()).select_from(filtrado['query'].order_by(None).subquery()))
+
+        ordenes= list(COLUMNAS_ORDENABLES)
+        if filtrado['columna_relevancia'] is not None:
+            ordenes.append('relevancia')
+        for sort_by in ordenes:
+            for order in ('asc', 'desc'):
+                query, _= ordenar_productos(filtrado['query'], sort_by, order, filtrado['columna_relevancia'])
+                #Pagina por numero (LIMIT/OFFSET)
+                imprimir_plan(f'{nombre_filtro} | orden {sort_by} {order} | pagina 2',
+                              query.limit(per_page).offset(per_page).statement)
+                #Pagina por cursor (solo para las columnas ordenables)
+                if sort_by in COLUMNAS_ORDENABLES:
+                    valores= ['' if sort_by in ('nombre', 'marca') else 0, 0]
+                    imprimir_plan(f'{nombre_filtro} | orden {sort_by} {order} | cursor',
+                                  query.filter(condicion_keyset(sort_by, order, valores)).limit(per_page + 1).statement)
+
+    #Verificacion de unicidad de agregar_producto / editar_producto
+    imprimir_plan('unicidad nombre + marca', Producto.query.filter(
+        Producto.nombre_normalizado == 'harina de almendras',
+        Producto.marca_normalizada == 'natura',
+        Producto.id != 0
+    ).limit(1).statement)
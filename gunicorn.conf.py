@@ -0,0 +1,66 @@
+# gunicorn.conf.py
+#Servidor de produccion: varios procesos (workers), cada uno con varios hilos
+#   gunicorn -c gunicorn.conf.py
+#
+#Todo se puede cambiar con variables de entorno:
+#   GUNICORN_BIND        donde escucha (127.0.0.1:8000)
+#   GUNICORN_WORKERS     procesos (2 por CPU + 1)
+#   GUNICORN_THREADS     hilos por proceso (4). Cada hilo usa una conexion del pool (SQLALCHEMY_POOL)
+#   GUNICORN_PRELOAD     1 = importa la app una vez en el proceso principal antes de crear los workers (arrancan mas
+#                        rapido y comparten memoria), pero kill -HUP ya no carga el codigo nuevo
+#   MIGRAR_AL_INICIAR    0 = no corre las migraciones al arrancar ni al recargar
+#
+#Recarga sin cortar (despues de actualizar el codigo): kill -HUP <pid del proceso principal>
+#Aplica las migraciones, levanta workers nuevos y los viejos terminan las peticiones que estaban atendiendo
+#kill -TERM lo apaga esperando a las peticiones en curso (hasta graceful_timeout)
+
+import multiprocessing
+import os
+import subprocess
+import sys
+
+carpeta= os.path.dirname(os.path.abspath(__file__))
+
+wsgi_app= 'wsgi:app'
+chdir= carpeta
+bind= os.environ.get('GUNICORN_BIND', '127.0.0.1:8000')
+workers= int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+#gthread: cada worker atiende varias peticiones a la vez con hilos (mientras uno espera a la db, otro trabaja)
+worker_class= 'gthread'
+threads= int(os.environ.get('GUNICORN_THREADS', 4))
+preload_app= os.environ.get('GUNICORN_PRELOAD') == '1'
+
+timeout= 30             #Un worker que no responde en 30s se reinicia
+graceful_timeout= 30    #Al recargar o apagar, tiempo para terminar las peticiones en curso
+keepalive= 5
+#Cada worker se reemplaza despues de ~2000 peticiones (con jitter para que no se reinicien todos juntos)
+max_requests= 2000
+max_requests_jitter= 200
+
+accesslog= os.environ.get('GUNICORN_ACCESSLOG')     #'-' para verlo en la consola
+errorlog= '-'
+
+
+#Las migraciones corren en otro proceso: si la app se importara en el proceso principal (sin preload_app), los
+#workers la heredarian ya importada y kill -HUP no cargaria el codigo nuevo
+def migrar(server):
+    if os.environ.get('MIGRAR_AL_INICIAR', '1') == '0':
+        return True
+    server.log.info('Aplicando migraciones')
+    proceso= subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', 'db', 'upgrade'], cwd=carpeta)
+    return proceso.returncode == 0
+
+def on_starting(server):
+    if not migrar(server):
+        raise SystemExit('Fallaron las migraciones, no se inicia el servidor.')
+
+#Al recargar no se corta el servicio: si fallan, se avisa y los workers nuevos arrancan igual
+def on_reload(server):
+    if not migrar(server):
+        server.log.error('Fallaron las migraciones al recargar.')
+
+#Con preload_app la app (y su engine) ya estaba importada antes del fork: cada worker arma su propio pool
+def post_fork(server, worker):
+    modulo= sys.modules.get('app')
+    if modulo is not None:
+        modulo.preparar_proceso_hijo()
@@ -0,0 +1,33 @@
+"""busqueda por trigramas
+
+Revision ID: 0682e35b7961
+Revises: 7b32cd03a011
+Create Date: 2026-10-18 16:43:24.534922
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0682e35b7961'
+down_revision = '7b32cd03a011'
+branch_labels = None
+depends_on = None
+
+
+#Solo en PostgreSQL: en SQLite la busqueda usa el indice FTS5 (flask reindexar-busqueda)
+def upgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_producto_nombre_trgm', 'producto', ['nombre_normalizado'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'nombre_normalizado': 'gin_trgm_ops'})
+    op.create_index('ix_producto_marca_trgm', 'producto', ['marca_normalizada'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'marca_normalizada': 'gin_trgm_ops'})
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_producto_marca_trgm', table_name='producto')
+    op.drop_index('ix_producto_nombre_trgm', table_name='producto')
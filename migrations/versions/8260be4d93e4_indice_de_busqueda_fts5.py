@@ -0,0 +1,66 @@
+"""indice de busqueda fts5
+
+Revision ID: 8260be4d93e4
+Revises: 8b8807c43129
+Create Date: 2026-10-18 17:05:41.318204
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8260be4d93e4'
+down_revision = '8b8807c43129'
+branch_labels = None
+depends_on = None
+
+
+#Solo en SQLite: la tabla FTS5 de la busqueda y sus triggers (ver SQL_INDICE_BUSQUEDA en app.py)
+#Antes la creaba python app.py al arrancar; ahora el esquema completo sale de las migraciones
+#Si ya existia (creada por la app o por flask reindexar-busqueda) queda como esta
+SQL_INDICE_BUSQUEDA= [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS producto_fts USING fts5(
+        nombre_normalizado, marca_normalizada,
+        content='producto', content_rowid='id',
+        tokenize='unicode61', prefix='2 3'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS producto_fts_ai AFTER INSERT ON producto BEGIN
+        INSERT INTO producto_fts(rowid, nombre_normalizado, marca_normalizada)
+        VALUES (new.id, new.nombre_normalizado, new.marca_normalizada);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS producto_fts_ad AFTER DELETE ON producto BEGIN
+        INSERT INTO producto_fts(producto_fts, rowid, nombre_normalizado, marca_normalizada)
+        VALUES ('delete', old.id, old.nombre_normalizado, old.marca_normalizada);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS producto_fts_au AFTER UPDATE OF nombre_normalizado, marca_normalizada ON producto BEGIN
+        INSERT INTO producto_fts(producto_fts, rowid, nombre_normalizado, marca_normalizada)
+        VALUES ('delete', old.id, old.nombre_normalizado, old.marca_normalizada);
+        INSERT INTO producto_fts(rowid, nombre_normalizado, marca_normalizada)
+        VALUES (new.id, new.nombre_normalizado, new.marca_normalizada);
+    END""",
+]
+
+
+def upgrade():
+    conn= op.get_bind()
+    if conn.dialect.name != 'sqlite':
+        return
+    #SQLite compilado sin FTS5: la busqueda sigue con ilike
+    if not conn.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar():
+        return
+    existia= conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='producto_fts'"
+    ).first() is not None
+    for sentencia in SQL_INDICE_BUSQUEDA:
+        op.execute(sentencia)
+    #Indexa los productos que ya estaban
+    if not existia:
+        op.execute("INSERT INTO producto_fts(producto_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for trigger in ('producto_fts_au', 'producto_fts_ad', 'producto_fts_ai'):
+        op.execute(f'DROP TRIGGER IF EXISTS {trigger}')
+    op.execute('DROP TABLE IF EXISTS producto_fts')
@@ -0,0 +1,73 @@
+# tests/conftest.py
+#app.py lee DATABASE_URL al importarse: los tests usan una base SQLite temporal (no tocan inventario.db)
+#Con TEST_DATABASE_URL corren contra otra base, por ejemplo un PostgreSQL local de prueba (sus tablas se borran)
+#Cada test arranca con las tablas vacias y sin nada en los caches de la app
+#
+#   python -m pytest
+#   TEST_DATABASE_URL=postgresql://localhost/prueba python -m pytest
+
+import os
+import random
+import tempfile
+
+import pytest
+
+_carpeta= tempfile.TemporaryDirectory()
+os.environ['DATABASE_URL']= os.environ.get('TEST_DATABASE_URL') or 'sqlite:///' + os.path.join(_carpeta.name, 'tests.db')
+
+from app import (app as app_flask, db, Producto, Categoria, producto_categoria, normalize_text, crear_indice_busqueda,
+                 registro_categorias, indice_sugerencias, _cache_paginas_listado, _cache_fragmentos_listado,
+                 _cache_total_productos, _cache_respuestas_api)
+
+#Nombres y marcas de dietetica (con tildes) para el catalogo de los tests
+TIPOS= ('Harina de Almendras', 'Avena Instantánea', 'Mix de Frutos Secos', 'Yerba Mate Orgánica', 'Aceite de Coco',
+        'Semillas de Chía', 'Granola sin TACC', 'Miel Pura')
+MARCAS= ('Natura', 'Granix', 'Dicomere', 'Taragüí', 'Wakas', 'Felices las Vacas')
+CATEGORIAS= 12
+
+
+#La version del catalogo vuelve a empezar con cada base: lo guardado para una version de otro test no sirve
+def limpiar_caches():
+    for cache in (_cache_paginas_listado, _cache_fragmentos_listado, _cache_total_productos, _cache_respuestas_api):
+        cache.limpiar()
+    registro_categorias.invalidar()
+    indice_sugerencias.reiniciar()
+
+@pytest.fixture
+def app():
+    with app_flask.app_context():
+        db.drop_all()
+        with db.engine.begin() as conn:
+            conn.exec_driver_sql('DROP TABLE IF EXISTS producto_fts')
+        db.create_all()
+        crear_indice_busqueda()
+        limpiar_caches()
+        yield app_flask
+        db.session.remove()
+
+@pytest.fixture
+def vaciar_caches(app):
+    return limpiar_caches
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+#300 productos en 12 categorias, cada uno con 0 a 4 (siempre los mismos)
+@pytest.fixture
+def catalogo(app):
+    rnd= random.Random(7)
+    db.session.execute(db.insert(Categoria), [{'id': i, 'nombre': f'Categoria {i}'} for i in range(1, CATEGORIAS + 1)])
+    productos, relaciones= [], []
+    for producto_id in range(1, 301):
+        nombre, marca= f'{rnd.choice(TIPOS)} {producto_id}', rnd.choice(MARCAS)
+        productos.append({'id': producto_id, 'nombre': nombre, 'nombre_normalizado': normalize_text(nombre),
+                          'marca': marca, 'marca_normalizada': normalize_text(marca),
+                          'precio': round(rnd.uniform(100, 5000), 2), 'stock': rnd.randint(0, 100)})
+        relaciones.extend({'producto_id': producto_id, 'categoria_id': cat_id}
+                          for cat_id in rnd.sample(range(1, CATEGORIAS + 1), rnd.randint(0, 4)))
+    db.session.execute(db.insert(Producto), productos)
+    db.session.execute(db.insert(producto_categoria), relaciones)
+    db.session.commit()
+    limpiar_caches()
+    return app
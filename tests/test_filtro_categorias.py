@@ -0,0 +1,62 @@
+# tests/test_filtro_categorias.py
+#filtrar_por_categorias (un solo GROUP BY ... HAVING) tiene que devolver lo mismo que el filtro original, un EXISTS por
+#categoria con AND o uno con todas las categorias con OR, y lo mismo que calcularlo en Python
+
+import random
+
+import pytest
+
+from app import db, Producto, Categoria, producto_categoria, filtrar_por_categorias, ENTERO_DB_MAXIMO
+
+
+def filtro_original(ids, logica):
+    query= Producto.query
+    if logica == 'and':
+        for cat_id in ids:
+            query= query.filter(Producto.categorias.any(Categoria.id == cat_id))
+    else:
+        query= query.filter(Producto.categorias.any(Categoria.id.in_(ids)))
+    return query
+
+def ids_de(query):
+    return {producto.id for producto in query.with_entities(Producto.id)}
+
+@pytest.fixture
+def categorias_por_producto(catalogo):
+    resultado= {producto_id: set() for producto_id in db.session.execute(db.select(Producto.id)).scalars()}
+    for producto_id, categoria_id in db.session.execute(db.select(producto_categoria)):
+        resultado[producto_id].add(categoria_id)
+    return resultado
+
+@pytest.mark.parametrize('logica', ['and', 'or'])
+def test_mismo_resultado_que_el_filtro_original(categorias_por_producto, logica):
+    rnd= random.Random(logica)
+    for _ in range(60):
+        #Incluye ids repetidos y categorias que no existen
+        ids= [rnd.randint(1, 14) for _ in range(rnd.randint(1, 4))]
+        if logica == 'and':
+            esperados= {p for p, cats in categorias_por_producto.items() if set(ids) <= cats}
+        else:
+            esperados= {p for p, cats in categorias_por_producto.items() if set(ids) & cats}
+        obtenidos= ids_de(filtrar_por_categorias(Producto.query, ids, logica))
+        assert obtenidos == esperados, ids
+        assert obtenidos == ids_de(filtro_original(ids, logica)), ids
+
+def test_con_and_hay_resultados(categorias_por_producto):
+    #Que la comparacion no pase solo porque todo da vacio
+    cats= next(cats for cats in categorias_por_producto.values() if len(cats) >= 2)
+    assert ids_de(filtrar_por_categorias(Producto.query, sorted(cats), 'and'))
+
+@pytest.mark.parametrize('logica', ['and', 'or'])
+def test_ids_fuera_de_la_columna(categorias_por_producto, logica):
+    enorme= ENTERO_DB_MAXIMO + 1
+    assert ids_de(filtrar_por_categorias(Producto.query, [enorme], logica)) == set()
+    con_validos= ids_de(filtrar_por_categorias(Producto.query, [1, enorme], logica))
+    if logica == 'and':
+        assert con_validos == set()
+    else:
+        assert con_validos == {p for p, cats in categorias_por_producto.items() if 1 in cats}
+
+def test_listado_con_ids_enormes(catalogo, client):
+    respuesta= client.get(f'/?categorias_filtro=1&categorias_filtro={10 ** 30}&logic_type=or')
+    assert respuesta.status_code == 200
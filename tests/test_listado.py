@@ -0,0 +1,59 @@
+# tests/test_listado.py
+#El listado hace siempre la misma cantidad de consultas, sin importar cuantos productos muestra (sin N+1)
+
+import pytest
+
+from app import (db, Producto, Categoria, contar_consultas, registro_categorias, mover_stock,
+                 incrementar_version_catalogo)
+
+
+def consultas_de(client, url):
+    with contar_consultas() as contador:
+        respuesta= client.get(url)
+    assert respuesta.status_code == 200
+    return contador['consultas']
+
+@pytest.mark.parametrize('url', ['/', '/?sort_by=precio&order=desc', '/?q=almendras',
+                                 '/?categorias_filtro=1&categorias_filtro=2&logic_type=or'])
+def test_consultas_no_dependen_de_los_productos_por_pagina(catalogo, client, vaciar_caches, monkeypatch, url):
+    cantidades= []
+    for por_pagina in (5, 21, 100):
+        monkeypatch.setitem(catalogo.config, 'PRODUCTOS_POR_PAGINA', por_pagina)
+        #Sin cache: cada pagina se arma desde la base
+        vaciar_caches()
+        cantidades.append(consultas_de(client, url))
+    assert cantidades[0] == cantidades[1] == cantidades[2], cantidades
+
+def test_pagina_repetida_sale_del_cache(catalogo, client):
+    primera= consultas_de(client, '/')
+    #La segunda vez solo se lee la version del catalogo
+    assert consultas_de(client, '/') < primera
+    etag= client.get('/').headers['ETag']
+    with contar_consultas() as contador:
+        respuesta= client.get('/', headers={'If-None-Match': etag})
+    assert respuesta.status_code == 304
+    assert contador['consultas'] == 1
+
+def test_contar_consultas_registra_las_sentencias(catalogo, client):
+    with contar_consultas() as contador:
+        client.get('/')
+    assert contador['consultas'] == len(contador['sentencias']) > 0
+    #Fuera del bloque ya no cuenta
+    antes= contador['consultas']
+    client.get('/')
+    assert contador['consultas'] == antes
+
+def test_registro_de_categorias_solo_cambia_con_las_categorias(catalogo, client):
+    lista, _= registro_categorias.obtener()
+    datos= registro_categorias.datos
+    producto_id= db.session.execute(db.select(Producto.id).limit(1)).scalar()
+    assert mover_stock(producto_id, 'entrada', 1)[1] is None
+    assert client.get('/').status_code == 200
+    assert registro_categorias.obtener() == (lista, datos[2]) and registro_categorias.datos is datos
+
+    #Renombrada desde otro proceso: este no llama a invalidar(), se entera por la version
+    categoria= db.session.get(Categoria, lista[0][0])
+    categoria.nombre= 'Zzz Renombrada'
+    incrementar_version_catalogo(categorias=True)
+    db.session.commit()
+    assert registro_categorias.obtener()[0][-1] == (categoria.id, 'Zzz Renombrada')
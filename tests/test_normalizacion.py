@@ -0,0 +1,32 @@
+# tests/test_normalizacion.py
+#normalize_text (tabla de traduccion + cache) y normalizar_textos tienen que dar exactamente lo mismo que la version
+#original con cualquier texto
+
+from hypothesis import given, settings, strategies as st
+
+from app import normalize_text, normalizar_textos, _normalizar
+from benchmarks.normalizacion import normalize_text_original, ALFABETO
+
+#Texto cualquiera (todo Unicode salvo surrogates) y texto armado con los caracteres dificiles de benchmarks.normalizacion
+#(tildes sueltas, espacios raros, "İ", "ß", ligaduras...), que al azar casi no aparecen
+cualquiera= st.text()
+dificiles= st.lists(st.sampled_from([c for grupo in ALFABETO.values() for c in grupo])).map(''.join)
+textos= cualquiera | dificiles
+
+
+@settings(max_examples=2000)
+@given(textos)
+def test_igual_que_la_version_original(texto):
+    assert normalize_text(texto) == normalize_text_original(texto)
+    #Con el cache ya cargado tiene que seguir dando lo mismo
+    assert normalize_text(texto) == _normalizar(texto) == normalize_text_original(texto)
+
+@given(st.lists(st.one_of(st.none(), textos)))
+def test_normalizar_textos(lista):
+    assert normalizar_textos(lista) == [normalize_text_original(texto) for texto in lista]
+
+def test_casos_conocidos():
+    assert normalize_text(None) is None
+    assert normalize_text('  Harina de   ALMENDRAS\t') == 'harina de almendras'
+    assert normalize_text('Ñandú Açaí') == 'nandu acai'
+    assert normalize_text('¡¿!?') is None
@@ -0,0 +1,79 @@
+# tests/test_postgresql.py
+#Caminos propios de PostgreSQL: indices de trigramas (pg_trgm), importacion con COPY e INSERT ... ON CONFLICT
+#Solo corren con TEST_DATABASE_URL=postgresql://... (ver conftest.py)
+
+import io
+import json
+
+import pytest
+
+from sqlalchemy.engine import make_url
+
+from app import (app as app_flask, db, Producto, Categoria, producto_categoria, importar_productos, insertar_productos_nuevos,
+                 trigramas_disponibles, filtrar_productos, normalize_text, mover_stock_lote, ENTERO_DB_MAXIMO)
+
+pytestmark= pytest.mark.skipif(make_url(app_flask.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() != 'postgresql',
+                               reason='Hace falta TEST_DATABASE_URL con una base PostgreSQL')
+
+
+def fila(nombre, marca, **extra):
+    return {'nombre': nombre, 'nombre_normalizado': normalize_text(nombre), 'marca': marca,
+            'marca_normalizada': normalize_text(marca), 'descripcion': None, 'precio': 10.0, 'stock': 5,
+            'stock_minimo': 0, **extra}
+
+def test_indices_de_trigramas(app):
+    assert trigramas_disponibles()
+    indices= set(db.session.execute(db.text("SELECT indexname FROM pg_indexes WHERE tablename = 'producto'")).scalars())
+    assert {'ix_producto_nombre_trgm', 'ix_producto_marca_trgm'} <= indices
+
+def test_busqueda_por_parecido(app, client):
+    db.session.execute(db.insert(Producto), [fila('Harina de Almendras', 'Natura'), fila('Almendras Tostadas', 'Dicomere'),
+                                             fila('Avena Instantanea', 'Granix')])
+    db.session.commit()
+    resultado= filtrar_productos('almendras', [], 'and')
+    assert resultado['columna_relevancia'] is not None
+    nombres= {p.nombre for p in resultado['query']}
+    assert nombres == {'Harina de Almendras', 'Almendras Tostadas'}
+    assert client.get('/?q=almendra&sort_by=relevancia').status_code == 200
+
+def test_importacion_con_copy(app):
+    db.session.add(Categoria(nombre='Sin TACC'))
+    db.session.add(Producto(**fila('Avena Instantanea', 'Granix')))
+    db.session.commit()
+    filas= [
+        #Tab, salto de linea y barra en la descripcion: tienen que pasar por el formato de texto de COPY sin cambios
+        {'nombre': 'Harina de Almendras', 'marca': 'Natura', 'precio': 10, 'stock': 3,
+         'descripcion': 'con\ttab y\nsalto \\ barra', 'categorias': 'Sin TACC'},
+        {'nombre': 'Avena instantánea', 'marca': 'GRANIX', 'precio': 5},
+        {'nombre': 'Yerba Mate', 'marca': 'Taragui', 'precio': 7, 'descripcion': None},
+    ]
+    archivo= io.StringIO('\n'.join(json.dumps(f) for f in filas))
+    reporte= importar_productos(archivo, 'jsonl', tamano_lote=2)
+    assert reporte['insertados'] == 2
+    assert [numero for numero, _ in reporte['rechazados']] == [2]
+
+    harina= Producto.query.filter_by(nombre='Harina de Almendras').one()
+    assert harina.descripcion == 'con\ttab y\nsalto \\ barra'
+    assert [c.nombre for c in harina.categorias] == ['Sin TACC']
+    assert Producto.query.filter_by(nombre='Yerba Mate').one().descripcion is None
+
+def test_on_conflict_no_aborta(app):
+    db.session.add(Producto(**fila('Avena Instantanea', 'Granix')))
+    db.session.commit()
+    #Como si otro proceso hubiera cargado la avena entre la verificacion y el INSERT
+    insertados= insertar_productos_nuevos([fila('Avena Instantanea', 'Granix'), fila('Yerba Mate', 'Taragui')])
+    db.session.commit()
+    assert list(insertados) == [('Yerba Mate', 'Taragui')]
+    assert Producto.query.count() == 2
+    assert db.session.execute(db.select(db.func.count()).select_from(producto_categoria)).scalar() == 0
+
+def test_lote_no_desborda_la_columna(app):
+    db.session.add_all([Producto(**fila('Avena Instantanea', 'Granix')), Producto(**fila('Yerba Mate', 'Taragui'))])
+    db.session.commit()
+    avena, yerba= (p.id for p in Producto.query.order_by(Producto.id))
+    #5 + ENTERO_DB_MAXIMO no entra en un INTEGER: falla esa linea, no todo el lote
+    reporte= mover_stock_lote([{'producto_id': avena, 'delta': ENTERO_DB_MAXIMO}, {'producto_id': yerba, 'delta': -1}])
+    assert reporte['aplicadas'] == 1
+    assert [indice for indice, _ in reporte['fallidas']] == [0]
+    assert reporte['fallidas'][0][1].startswith('El stock no puede pasar de')
+    assert db.session.get(Producto, avena).stock == 5
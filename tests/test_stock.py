@@ -0,0 +1,94 @@
+# tests/test_stock.py
+#Movimientos de stock con muchos hilos a la vez: no se pierde ninguno, el stock nunca queda negativo y el historial
+#(movimiento_stock) explica el stock final paso a paso
+
+import random
+import threading
+
+import pytest
+
+from app import db, Producto, MovimientoStock, mover_stock, mover_stock_lote, ENTERO_DB_MAXIMO
+
+HILOS= 16
+MOVIMIENTOS_POR_HILO= 25
+STOCK_INICIAL= 20
+
+
+@pytest.fixture
+def productos(app):
+    db.session.execute(db.insert(Producto), [
+        {'id': i, 'nombre': f'Producto {i}', 'nombre_normalizado': f'producto {i}', 'marca': 'Marca',
+         'marca_normalizada': 'marca', 'precio': 1.0, 'stock': STOCK_INICIAL}
+        for i in (1, 2, 3)
+    ])
+    db.session.commit()
+    return (1, 2, 3)
+
+def test_movimientos_concurrentes(app, productos):
+    rnd= random.Random(13)
+    #Un poco mas de salidas que de entradas para que tambien se rechacen salidas por falta de stock
+    planes= [[(rnd.choice(productos), rnd.choice(('entrada', 'salida', 'salida')), rnd.randint(1, 5))
+              for _ in range(MOVIMIENTOS_POR_HILO)] for _ in range(HILOS)]
+    aplicados= []
+    errores= []
+    barrera= threading.Barrier(HILOS)
+
+    def trabajar(plan):
+        barrera.wait()
+        with app.app_context():
+            for producto_id, tipo, cantidad in plan:
+                movimiento, error= mover_stock(producto_id, tipo, cantidad)
+                if error:
+                    errores.append(error)
+                else:
+                    aplicados.append((producto_id, tipo, cantidad))
+            db.session.remove()
+
+    hilos= [threading.Thread(target=trabajar, args=(plan,)) for plan in planes]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    #Los unicos rechazos son por falta de stock
+    assert all(codigo == 409 and mensaje.startswith('Stock insuficiente') for codigo, mensaje in errores)
+    assert len(aplicados) + len(errores) == HILOS * MOVIMIENTOS_POR_HILO
+
+    for producto_id in productos:
+        producto= db.session.get(Producto, producto_id)
+        esperado= STOCK_INICIAL + sum(c if t == 'entrada' else -c for p, t, c in aplicados if p == producto_id)
+        assert producto.stock == esperado
+        historial= db.session.execute(db.select(MovimientoStock).filter_by(producto_id=producto_id)
+                                      .order_by(MovimientoStock.version)).scalars().all()
+        assert len(historial) == sum(1 for p, _, _ in aplicados if p == producto_id)
+        assert producto.version - 1 == len(historial)
+        #Cada movimiento parte del stock que dejo el anterior
+        stock= STOCK_INICIAL
+        for version, movimiento in enumerate(historial, start=2):
+            stock += movimiento.cantidad if movimiento.tipo == 'entrada' else -movimiento.cantidad
+            assert movimiento.version == version
+            assert movimiento.stock_resultante == stock >= 0
+        assert stock == producto.stock
+
+def test_version_esperada(app, productos):
+    movimiento, error= mover_stock(1, 'entrada', 2, version_esperada=1)
+    assert error is None and movimiento['version'] == 2
+    _, error= mover_stock(1, 'salida', 1, version_esperada=1)
+    assert error[0] == 409
+    assert db.session.get(Producto, 1).stock == STOCK_INICIAL + 2
+
+@pytest.mark.parametrize('cantidad', [10 ** 30, -(10 ** 30), ENTERO_DB_MAXIMO + 1, 0, 1.5, '3', True])
+def test_cantidades_invalidas(client, productos, cantidad):
+    respuesta= client.post('/productos/1/stock', json={'tipo': 'entrada', 'cantidad': cantidad})
+    assert respuesta.status_code == 400
+    #En el lote falla la linea, no todo el pedido
+    respuesta= client.post('/productos/stock/lote', json=[{'producto_id': 1, 'delta': cantidad}])
+    assert respuesta.status_code == 200
+    assert respuesta.get_json()['aplicadas'] == 0 and len(respuesta.get_json()['fallidas']) == 1
+    assert db.session.get(Producto, 1).stock == STOCK_INICIAL
+
+def test_entrada_hasta_el_maximo(app, productos):
+    _, error= mover_stock(1, 'entrada', ENTERO_DB_MAXIMO)
+    assert error[0] == 409
+    reporte= mover_stock_lote([{'producto_id': 1, 'delta': ENTERO_DB_MAXIMO}, {'producto_id': 2, 'delta': -1}])
+    assert reporte['aplicadas'] == 1 and [indice for indice, _ in reporte['fallidas']] == [0]
@@ -0,0 +1,49 @@
+# tests/test_sugerencias.py
+#El indice de las sugerencias se vuelve a armar solo cuando cambian los nombres: agregar, eliminar, renombrar, importar.
+#Los movimientos de stock y los cambios de precio no lo invalidan
+
+import pytest
+
+from app import (db, Producto, indice_sugerencias, version_nombres_catalogo, mover_stock, mover_stock_lote,
+                 reajustar_precios)
+
+
+@pytest.fixture
+def productos(app):
+    db.session.execute(db.insert(Producto), [
+        {'id': i, 'nombre': nombre, 'nombre_normalizado': nombre.lower(), 'marca': 'Marca',
+         'marca_normalizada': 'marca', 'precio': 10.0, 'stock': 5}
+        for i, nombre in ((1, 'Harina de Almendras'), (2, 'Harina de Arroz'), (3, 'Avena'))
+    ])
+    db.session.commit()
+    return (1, 2, 3)
+
+def editar(client, producto_id, nombre, precio):
+    return client.post(f'/editar_producto/{producto_id}', data={
+        'nombre': nombre, 'marca': 'Marca', 'descripcion': '', 'precio': precio, 'stock': 5, 'stock_minimo': 0,
+    })
+
+def test_stock_y_precios_no_invalidan_el_indice(app, productos):
+    datos= indice_sugerencias.obtener()
+    version= version_nombres_catalogo()
+    assert mover_stock(1, 'entrada', 3)[1] is None
+    assert mover_stock_lote([{'producto_id': 2, 'delta': -1}])['aplicadas'] == 1
+    assert reajustar_precios('porcentaje', 10, marca='Marca', motivo='Test')[1] is None
+    assert version_nombres_catalogo() == version
+    assert indice_sugerencias.obtener() is datos and not indice_sugerencias.reconstruyendo
+
+def test_nombres_invalidan_el_indice(app, client, productos, monkeypatch):
+    monkeypatch.setitem(app.config, 'WTF_CSRF_ENABLED', False)
+    version= version_nombres_catalogo()
+    #Solo cambia el precio: los nombres siguen iguales
+    assert editar(client, 3, 'Avena', 12.0).status_code == 302
+    assert version_nombres_catalogo() == version
+    assert editar(client, 3, 'Avena Arrollada', 12.0).status_code == 302
+    assert version_nombres_catalogo() == version + 1
+    assert client.post('/eliminar_producto/1').status_code == 302
+    assert version_nombres_catalogo() == version + 2
+
+    #El hilo de fondo hace esto mismo: se llama directo para no esperarlo
+    indice_sugerencias._reconstruir()
+    assert [s['id'] for s in indice_sugerencias.buscar('a')] == [3, 2]
+    assert indice_sugerencias.buscar('arroll') == [{'id': 3, 'nombre': 'Avena Arrollada', 'marca': 'Marca'}]
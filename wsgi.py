@@ -0,0 +1,5 @@
+# wsgi.py
+#Punto de entrada para los servidores WSGI: gunicorn -c gunicorn.conf.py (o cualquier otro con wsgi:app)
+from app import create_app
+
+app= create_app()